@@ -5,10 +5,14 @@
 import time
 from typing import List
 
+import numpy as np
+
 from adi.ad9081_mc import QuadMxFE
+from adi.jesd_monitor import jesd_monitor
+from adi.multi_som import multi_som
 
 
-class QuadMxFE_multi(object):
+class QuadMxFE_multi(multi_som):
     """ADQUADMXFExEBZ Multi-SOM Manager
 
     parameters:
@@ -46,6 +50,8 @@ class QuadMxFE_multi(object):
         self._resync_tx = False
         self._rx_initialized = False
         self._request_sysref_carrier = False
+        self._rx_stacked = False
+        self.rx_timestamps = []
         self.primary = QuadMxFE(uri=primary_uri)
         self.secondaries = []
         self.samples_primary = []
@@ -54,7 +60,7 @@ class QuadMxFE_multi(object):
             self.secondaries.append(QuadMxFE(uri=uri))
 
         for dev in self.secondaries + [self.primary]:
-            dev._rxadc.set_kernel_buffers_count(1)
+            dev.rx_kernel_buffers_count = 1
 
         self.primary._clock_chip_ext = self.primary._ctx.find_device("hmc7044-ext")
 
@@ -76,6 +82,16 @@ class QuadMxFE_multi(object):
         for dev in self.secondaries + [self.primary]:
             dev.rx_buffer_size = value
 
+    @property
+    def rx_stacked(self):
+        """rx_stacked: Return captures from rx() as one 2D array of shape
+        (channels, samples) instead of a list of arrays"""
+        return self._rx_stacked
+
+    @rx_stacked.setter
+    def rx_stacked(self, value):
+        self._rx_stacked = bool(value)
+
     def __read_jesd_status_all_devs(self, attr, islink=False):
         for dev in self.secondaries + [self.primary]:
             if islink:
@@ -93,6 +109,22 @@ class QuadMxFE_multi(object):
                     if attr in s[dev]:
                         print("JESD {}: {} ({})".format(attr, s[dev][attr], dev))
 
+    def monitor_jesd(self, interval=1.0, **kwargs):
+        """monitor_jesd: Create a JESD link health monitor for all devices
+
+        parameters:
+            interval: type=float
+                Seconds between samples
+            kwargs:
+                Other arguments of adi.jesd_monitor
+
+        returns: type=adi.jesd_monitor
+            Monitor with one source per device, named by URI. Call start()
+            or use it as a context manager to begin sampling
+        """
+        sources = {dev.uri: dev for dev in [self.primary] + self.secondaries}
+        return jesd_monitor(sources, interval, **kwargs)
+
     def __read_jesd_status(self):
         self.__read_jesd_status_all_devs("Link status")
         self.__read_jesd_status_all_devs("SYSREF captured")
@@ -248,19 +280,23 @@ class QuadMxFE_multi(object):
             dev._clock_chip.reg_write(0xCC + offs, int(digital) & 0x1F)
 
     def __rx_dma_arm(self):
-        for dev in self.secondaries + [self.primary]:
+        def arm(dev):
             if self._dma_show_arming:
                 print("--DMA ARMING--", dev.uri)
             dev.rx_sync_start = "arm"
             if self._dma_show_arming:
                 print("\n--DMA ARMED--", dev.uri)
 
+        self._for_all_devs(arm, self.secondaries + [self.primary])
+
     def __dds_sync_enable(self, enable):
-        for dev in self.secondaries + [self.primary]:
+        def arm(dev):
             if self._dma_show_arming:
                 print("--DAC SYNC ARMING--", dev.uri)
             dev.tx_sync_start = "arm"
 
+        self._for_all_devs(arm, self.secondaries + [self.primary])
+
     def sysref_request(self):
         """ sysref_request: Sysref request for parent HMC7044 """
         self.primary._clock_chip_ext.attrs["sysref_request"].value = "1"
@@ -275,13 +311,11 @@ class QuadMxFE_multi(object):
         retries = 10
         for _ in range(retries):
             try:
-                for dev in [self.primary] + self.secondaries:
-                    dev.jesd204_fsm_ctrl = 0
+                self._for_all_devs(lambda dev: setattr(dev, "jesd204_fsm_ctrl", 0))
 
                 self.__unsync()
 
-                for dev in [self.primary] + self.secondaries:
-                    dev.jesd204_fsm_ctrl = 1
+                self._for_all_devs(lambda dev: setattr(dev, "jesd204_fsm_ctrl", 1))
 
                 self._jesd204_fsm_sync()
 
@@ -295,9 +329,7 @@ class QuadMxFE_multi(object):
                     self.__read_jesd_status()
                     self.__read_jesd_link_status()
 
-                for dev in [self.primary] + self.secondaries:
-                    dev.rx_destroy_buffer()
-                    dev._rx_init_channels()
+                self._for_all_devs(self._rx_recreate_buffer)
                 return
             except:  # noqa: E722
                 print("Re-initializing due to lock-up")
@@ -308,26 +340,38 @@ class QuadMxFE_multi(object):
         """Receive data from multiple hardware buffers for each channel index in
         rx_enabled_channels of each child object (primary,secondaries[indx]).
 
+        Devices are armed, set up and refilled in parallel, one worker per
+        context. With rx_reuse_buffers set, buffers from the previous capture
+        are re-armed instead of recreated. rx_timestamps holds the time in seconds from the SYSREF
+        request until the data of each device was received.
+
         returns: type=numpy.array or list of numpy.array
             An array or list of arrays when more than one receive channel
             is enabled containing samples from a channel or set of channels.
-            Data will be complex when using a complex data device.
+            Data will be complex when using a complex data device. With
+            rx_stacked set, a single 2D array of shape (channels, samples)
         """
         if not self._rx_initialized:
             self._pre_rx_setup()
             self._rx_initialized = True
         data = []
         self.__rx_dma_arm()
-        # Recreate all buffers
-        for dev in [self.primary] + self.secondaries:
-            dev.rx_destroy_buffer()
-            dev._rx_init_channels()
+        self._rx_prepare_buffers()
 
         if self._resync_tx:
             self.__dds_sync_enable(1)
 
         self.sysref_request()
-
-        for dev in [self.primary] + self.secondaries:
-            data += dev.rx()
+        sysref_time = time.perf_counter()
+
+        def capture(dev):
+            samples = dev.rx()
+            return samples, time.perf_counter() - sysref_time
+
+        captures = self._for_all_devs(capture)
+        self.rx_timestamps = [t for _, t in captures]
+        for samples, _ in captures:
+            data += samples
+        if self._rx_stacked:
+            return np.stack(data)
         return data
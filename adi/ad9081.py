@@ -2,6 +2,7 @@
 #
 # SPDX short identifier: ADIBSD
 
+from math import isnan
 from typing import Dict, List
 
 from adi.context_manager import context_manager
@@ -50,6 +51,20 @@ def _sortconv(chans_names, noq=False, dds=False):
     return chans_names_out
 
 
+def _coarse_labels(paths, output):
+    """Map channel names to the coarse DDC, or DUC when output is True, they
+    belong to in a path map"""
+    labels = {}
+    for converter, cdcs in paths.items():
+        if ("ADC" in converter) == output:
+            continue
+        for cdc, fdcs in cdcs.items():
+            for fdc in fdcs.values():
+                for name in fdc["channels"]:
+                    labels.setdefault(name, cdc)
+    return labels
+
+
 class ad9081(rx_tx, context_manager, sync_start):
     """AD9081 Mixed-Signal Front End (MxFE)"""
 
@@ -68,6 +83,7 @@ class ad9081(rx_tx, context_manager, sync_start):
     _tx_attr_only_channel_names: List[str] = []
 
     _path_map: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+    __hop_slots = None
 
     def __init__(self, uri=""):
 
@@ -174,6 +190,116 @@ class ad9081(rx_tx, context_manager, sync_start):
     # we cannot really get the profile. The driver will just throw EPERM
     pfilt_config = property(None, write_pfilt_config)
 
+    def _coarse_channels(self, output):
+        """Device, channel name and path_map label of each coarse DDC, or
+        coarse DUC when output is True, in the order of the main NCO
+        properties"""
+        if output:
+            names = self._tx_coarse_duc_channel_names
+        else:
+            names = self._rx_coarse_ddc_channel_names
+        labels = _coarse_labels(self._path_map, output)
+        return [(self._ctrl, name, labels.get(name, name)) for name in names]
+
+    def __hop_loaded(self, output):
+        if self.__hop_slots is None:
+            self.__hop_slots = {False: {}, True: {}}
+        return self.__hop_slots[output]
+
+    def hop_plan(self, table, output=False, refresh=False):
+        """Program fast frequency hopping NCO slots from a table
+
+        The table is validated before anything is written. Slots known to
+        already hold the requested values are skipped, so updating a plan
+        only rewrites the slots that changed. Writing the main NCO
+        frequencies or phases directly clears what is known about the slots.
+
+        parameters:
+            table: type=list
+                Rows of (slot, converter, frequency, phase). slot is in range
+                [0,15] for receive and [0,30] for transmit. converter is
+                either the index of the coarse DDC (DUC) in the order of
+                rx_main_nco_frequencies (tx_main_nco_frequencies) or its
+                label from path_map, like "CDDC0". phase is optional and
+                not available for transmit slots
+            output: type=bool
+                Program transmit slots of the coarse DUCs instead of receive
+                slots of the coarse DDCs
+            refresh: type=bool
+                Write all rows, even slots known to hold the same values
+
+        returns: type=int
+            Number of slots written
+        """
+        chans = self._coarse_channels(output)
+        labels = {label: i for i, (_, _, label) in enumerate(chans)}
+        num_slots = 31 if output else 16
+        rows = []
+        for row in table:
+            if len(row) not in (3, 4):
+                raise Exception(
+                    "Hop plan rows must be (slot, converter, frequency, phase)"
+                )
+            slot, converter, frequency = row[:3]
+            phase = row[3] if len(row) == 4 else None
+            if isinstance(converter, str):
+                if converter not in labels:
+                    raise Exception(
+                        "Converter {} not found. Must be one of {}".format(
+                            converter, list(labels)
+                        )
+                    )
+                converter = labels[converter]
+            elif not 0 <= int(converter) < len(chans):
+                raise Exception(
+                    "Converter {} out of range [0,{}]".format(converter, len(chans) - 1)
+                )
+            if not 0 <= int(slot) < num_slots:
+                raise Exception(
+                    "Hop slot {} out of range [0,{}]".format(slot, num_slots - 1)
+                )
+            if phase is not None and isnan(phase):
+                phase = None
+            if phase is not None and output:
+                raise Exception("Transmit hop slots have no phase")
+            phase = None if phase is None else int(phase)
+            rows.append((int(converter), int(slot), int(frequency), phase))
+
+        loaded = self.__hop_loaded(output)
+        if refresh:
+            loaded.clear()
+        freq_attr = "main_nco_ffh_frequency" if output else "main_nco_frequency"
+        written = 0
+        for converter, slot, frequency, phase in sorted(rows, key=lambda r: r[:2]):
+            known = loaded.get((converter, slot))
+            if known and known[0] == frequency and phase in (None, known[1]):
+                continue
+            ctrl, name, _ = chans[converter]
+            loaded.pop((converter, slot), None)
+            self._set_iio_attr(name, "main_nco_ffh_index", output, slot, ctrl)
+            self._set_iio_attr(name, freq_attr, output, frequency, ctrl)
+            if phase is not None:
+                self._set_iio_attr(name, "main_nco_phase", output, phase, ctrl)
+            elif known:
+                phase = known[1]
+            loaded[(converter, slot)] = (frequency, phase)
+            written += 1
+        return written
+
+    @property
+    def rx_hop_plan(self):
+        """rx_hop_plan: Receive NCO hop slots written by hop_plan as a sorted
+        list of (slot, converter, frequency, phase)"""
+        loaded = self.__hop_loaded(False)
+        return sorted((s, c, f, p) for (c, s), (f, p) in loaded.items())
+
+    @property
+    def tx_hop_plan(self):
+        """tx_hop_plan: Transmit NCO hop slots written by hop_plan as a sorted
+        list of (slot, converter, frequency, phase)"""
+        loaded = self.__hop_loaded(True)
+        return sorted((s, c, f, p) for (c, s), (f, p) in loaded.items())
+
     @property
     def rx_channel_nco_frequencies(self):
         """rx_channel_nco_frequencies: Receive path fine DDC NCO frequencies"""
@@ -212,6 +338,7 @@ class ad9081(rx_tx, context_manager, sync_start):
         self._set_iio_attr_int_vec(
             self._rx_coarse_ddc_channel_names, "main_nco_frequency", False, value,
         )
+        self.__hop_loaded(False).clear()
 
     @property
     def rx_main_nco_phases(self):
@@ -225,6 +352,7 @@ class ad9081(rx_tx, context_manager, sync_start):
         self._set_iio_attr_int_vec(
             self._rx_coarse_ddc_channel_names, "main_nco_phase", False, value,
         )
+        self.__hop_loaded(False).clear()
 
     @property
     def rx_test_mode(self):
@@ -481,6 +609,7 @@ class ad9081(rx_tx, context_manager, sync_start):
         self._set_iio_attr_int_vec(
             self._tx_coarse_duc_channel_names, "main_nco_ffh_frequency", True, value,
         )
+        self.__hop_loaded(True).clear()
 
     @property
     def tx_main_ffh_index(self):
@@ -4,7 +4,7 @@
 
 from typing import Dict, List
 
-from adi.ad9081 import ad9081
+from adi.ad9081 import _coarse_labels, ad9081
 from adi.attribute import attribute
 from adi.context_manager import context_manager
 from adi.one_bit_adc_dac import one_bit_adc_dac
@@ -194,6 +194,20 @@ class ad9081_mc(ad9081):
                         self._tx_coarse_duc_channel_names[chip].append(channels[0])
                         self._tx_fine_duc_channel_names[chip] += channels
 
+    def _coarse_channels(self, output):
+        if output:
+            names = self._tx_coarse_duc_channel_names
+        else:
+            names = self._rx_coarse_ddc_channel_names
+        chans = []
+        for dev in self._default_ctrl_names:
+            ctrl = self._ctx.find_device(dev)
+            labels = _coarse_labels(self._path_map.get(dev, {}), output)
+            for name in names.get(dev, []):
+                label = "{}:{}".format(dev, labels.get(name, name))
+                chans.append((ctrl, name, label))
+        return chans
+
     def _map_inputs_to_dict(self, channel_names_dict, attr, output, values):
         if not isinstance(values, dict):
             # If passed an array it must be split across the devices
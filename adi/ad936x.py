@@ -2,6 +2,7 @@
 #
 # SPDX short identifier: ADIBSD
 
+from adi import ad936x_rates
 from adi.context_manager import context_manager
 from adi.rx_tx import rx_tx_def
 
@@ -18,6 +19,9 @@ class ad9364(rx_tx_def, context_manager):
     _rx_data_device_name = "cf-ad9361-lpc"
     _tx_data_device_name = "cf-ad9361-dds-core-lpc"
     _device_name = ""
+    __fir_loaded = None
+    __fir_enabled = False
+    __fir_rate = 0
 
     @property
     def filter(self):
@@ -29,6 +33,8 @@ class ad9364(rx_tx_def, context_manager):
         with open(value, "r") as file:
             data = file.read()
         self.sample_rate = 3000000
+        self.__fir_loaded = None
+        self.__fir_enabled = False
         self._set_iio_attr("out", "voltage_filter_fir_en", False, 0)
         self._set_iio_dev_attr_str("filter_fir_config", data)
         self._set_iio_attr("out", "voltage_filter_fir_en", False, 1)
@@ -76,7 +82,7 @@ class ad9364(rx_tx_def, context_manager):
     @property
     def rx_rf_bandwidth(self):
         """rx_rf_bandwidth: Bandwidth of front-end analog filter of RX path"""
-        return self._get_iio_attr("voltage0", "rf_bandwidth", False)
+        return self._get_iio_attr_int("voltage0", "rf_bandwidth", False)
 
     @rx_rf_bandwidth.setter
     def rx_rf_bandwidth(self, value):
@@ -85,7 +91,7 @@ class ad9364(rx_tx_def, context_manager):
     @property
     def tx_rf_bandwidth(self):
         """tx_rf_bandwidth: Bandwidth of front-end analog filter of TX path"""
-        return self._get_iio_attr("voltage0", "rf_bandwidth", True)
+        return self._get_iio_attr_int("voltage0", "rf_bandwidth", True)
 
     @tx_rf_bandwidth.setter
     def tx_rf_bandwidth(self, value):
@@ -94,7 +100,7 @@ class ad9364(rx_tx_def, context_manager):
     @property
     def sample_rate(self):
         """sample_rate: Sample rate RX and TX paths in samples per second"""
-        return self._get_iio_attr("voltage0", "sampling_frequency", False)
+        return self._get_iio_attr_int("voltage0", "sampling_frequency", False)
 
     @sample_rate.setter
     def sample_rate(self, rate):
@@ -103,94 +109,52 @@ class ad9364(rx_tx_def, context_manager):
                 "Error: Does not currently support sample rates below 521e3"
             )
 
-        # The following was converted from ad9361_set_bb_rate() in libad9361-iio
-        # fmt: off
-        if (rate <= 20000000):
-            dec = 4
-            fir = [
-                -15, -27, -23, -6, 17, 33, 31, 9, -23, -47, -45, -13, 34, 69,
-                67, 21, -49, -102, -99, -32, 69, 146, 143, 48, -96, -204, -200,
-                -69, 129, 278, 275, 97, -170, -372, -371, -135, 222, 494, 497,
-                187, -288, -654, -665, -258, 376, 875, 902, 363, -500, -1201,
-                -1265, -530, 699, 1748, 1906, 845, -1089, -2922, -3424, -1697,
-                2326, 7714, 12821, 15921, 15921, 12821, 7714, 2326, -1697,
-                -3424, -2922, -1089, 845, 1906, 1748, 699, -530, -1265, -1201,
-                -500, 363, 902, 875, 376, -258, -665, -654, -288, 187, 497,
-                494, 222, -135, -371, -372, -170, 97, 275, 278, 129, -69, -200,
-                -204, -96, 48, 143, 146, 69, -32, -99, -102, -49, 21, 67, 69,
-                34, -13, -45, -47, -23, 9, 31, 33, 17, -6, -23, -27, -15
-            ]
-            taps = 128
-        elif (rate <= 40000000):
-            dec = 2
-            fir = [
-                -0, 0, 1, -0, -2, 0, 3, -0, -5, 0, 8, -0, -11, 0, 17, -0, -24,
-                0, 33, -0, -45, 0, 61, -0, -80, 0, 104, -0, -134, 0, 169, -0,
-                -213, 0, 264, -0, -327, 0, 401, -0, -489, 0, 595, -0, -724, 0,
-                880, -0, -1075, 0, 1323, -0, -1652, 0, 2114, -0, -2819, 0,
-                4056, -0, -6883, 0, 20837, 32767, 20837, 0, -6883, -0, 4056, 0,
-                -2819, -0, 2114, 0, -1652, -0, 1323, 0, -1075, -0, 880, 0,
-                -724, -0, 595, 0, -489, -0, 401, 0, -327, -0, 264, 0, -213, -0,
-                169, 0, -134, -0, 104, 0, -80, -0, 61, 0, -45, -0, 33, 0, -24,
-                -0, 17, 0, -11, -0, 8, 0, -5, -0, 3, 0, -2, -0, 1, 0, -0, 0
-            ]
-            taps = 128
-        elif (rate <= 53333333):
-            dec = 2
-            fir = [
-                -4, 0, 8, -0, -14, 0, 23, -0, -36, 0, 52, -0, -75, 0, 104, -0,
-                -140, 0, 186, -0, -243, 0, 314, -0, -400, 0, 505, -0, -634, 0,
-                793, -0, -993, 0, 1247, -0, -1585, 0, 2056, -0, -2773, 0, 4022,
-                -0, -6862, 0, 20830, 32767, 20830, 0, -6862, -0, 4022, 0,
-                -2773, -0, 2056, 0, -1585, -0, 1247, 0, -993, -0, 793, 0, -634,
-                -0, 505, 0, -400, -0, 314, 0, -243, -0, 186, 0, -140, -0, 104,
-                0, -75, -0, 52, 0, -36, -0, 23, 0, -14, -0, 8, 0, -4, 0
-            ]
-            taps = 96
-        else:
-            dec = 2
-            fir = [
-                -58, 0, 83, -0, -127, 0, 185, -0, -262, 0, 361, -0, -488, 0,
-                648, -0, -853, 0, 1117, -0, -1466, 0, 1954, -0, -2689, 0, 3960,
-                -0, -6825, 0, 20818, 32767, 20818, 0, -6825, -0, 3960, 0,
-                -2689, -0, 1954, 0, -1466, -0, 1117, 0, -853, -0, 648, 0, -488,
-                -0, 361, 0, -262, -0, 185, 0, -127, -0, 83, 0, -58, 0
-            ]
-            taps = 64
-        # fmt: on
-        current_rate = self._get_iio_attr("voltage0", "sampling_frequency", False)
-
-        if self._get_iio_attr("out", "voltage_filter_fir_en", False):
-            if current_rate <= (25000000 // 12):
+        band = ad936x_rates.fir_band(rate)
+        if (
+            self.__fir_enabled
+            and self.__fir_loaded == band
+            and rate > ad936x_rates.FIR_LOW_RATE
+            and self.__fir_rate > ad936x_rates.FIR_LOW_RATE
+        ):
+            # Filter for this band already running, only the rate changes
+            self._set_iio_attr("voltage0", "sampling_frequency", False, rate)
+            self.__fir_rate = rate
+            return
+
+        self.__fir_enabled = False
+        current_rate = self._get_iio_attr_int("voltage0", "sampling_frequency", False)
+
+        if self._get_iio_attr_int("out", "voltage_filter_fir_en", False):
+            if current_rate <= ad936x_rates.FIR_LOW_RATE:
                 self._set_iio_attr("voltage0", "sampling_frequency", False, 3000000)
             self._set_iio_attr("out", "voltage_filter_fir_en", False, 0)
 
-        # Assemble FIR filter config string
-        fir_config_string = ""
-        fir_config_string += "RX 3 GAIN -6 DEC " + str(dec) + "\n"
-        fir_config_string += "TX 3 GAIN 0 INT " + str(dec) + "\n"
-        for i in range(taps):
-            fir_config_string += str(fir[i]) + "," + str(fir[i]) + "\n"
-        fir_config_string += "\n"
-        self._set_iio_dev_attr_str("filter_fir_config", fir_config_string)
-
-        if rate <= (25000000 // 12):
-            readbuf = self._get_iio_dev_attr_str("tx_path_rates")
-            dacrate = int(readbuf.split(" ")[1].split(":")[1])
-            txrate = int(readbuf.split(" ")[5].split(":")[1])
+        if self.__fir_loaded != band:
+            self.__fir_loaded = None
+            self._set_iio_dev_attr_str(
+                "filter_fir_config", ad936x_rates.fir_config(band)
+            )
+            self.__fir_loaded = band
+
+        if rate <= ad936x_rates.FIR_LOW_RATE:
+            rates = self._get_iio_dev_attr_list("tx_path_rates")
+            dacrate = int(rates[1])
+            txrate = int(rates[5])
             max_rate = (dacrate // txrate) * 16
-            if max_rate < taps:
+            if max_rate < ad936x_rates.fir_taps(band):
                 self._set_iio_attr("voltage0", "sampling_frequency", False, 3000000)
             self._set_iio_attr("out", "voltage_filter_fir_en", False, 1)
             self._set_iio_attr("voltage0", "sampling_frequency", False, rate)
         else:
             self._set_iio_attr("voltage0", "sampling_frequency", False, rate)
             self._set_iio_attr("out", "voltage_filter_fir_en", False, 1)
+        self.__fir_enabled = True
+        self.__fir_rate = rate
 
     @property
     def rx_lo(self):
         """rx_lo: Carrier frequency of RX path"""
-        return self._get_iio_attr("altvoltage0", "frequency", True)
+        return self._get_iio_attr_int("altvoltage0", "frequency", True)
 
     @rx_lo.setter
     def rx_lo(self, value):
@@ -199,7 +163,7 @@ class ad9364(rx_tx_def, context_manager):
     @property
     def tx_lo(self):
         """tx_lo: Carrier frequency of TX path"""
-        return self._get_iio_attr("altvoltage1", "frequency", True)
+        return self._get_iio_attr_int("altvoltage1", "frequency", True)
 
     @tx_lo.setter
     def tx_lo(self, value):
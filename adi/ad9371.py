@@ -5,6 +5,7 @@
 from adi.context_manager import context_manager
 from adi.jesd import jesd
 from adi.obs import obs
+from adi.profile_cache import profiles
 from adi.rx_tx import rx_tx
 from adi.sync_start import sync_start
 
@@ -52,6 +53,37 @@ class ad9371(rx_tx, context_manager, sync_start):
     def ensm_mode(self, value):
         self._set_iio_dev_attr_str("ensm_mode", value)
 
+    @property
+    def profile(self):
+        """Load profile file. Provide path to profile file to attribute.
+        A profile with the same contents as the last loaded is skipped,
+        use write_profile with force to reload it"""
+        return self._get_iio_dev_attr("profile_config")
+
+    @profile.setter
+    def profile(self, value):
+        self.write_profile(value)
+
+    def write_profile(self, value, force=False):
+        """Load a profile file on the device
+
+        parameters:
+            value: type=string
+                Path of the profile file
+            force: type=bool
+                Load the profile even when its contents are the last loaded,
+                for example to reset the device
+        """
+        digest, data = profiles.read(value)
+        if not force and profiles.is_loaded(
+            self._ctx, self._ctrl, "profile_config", digest
+        ):
+            return
+        profiles.set_loaded(self._ctx, self._ctrl, "profile_config", None)
+        self._set_iio_dev_attr_str("profile_config", data)
+        profiles.set_loaded(self._ctx, self._ctrl, "profile_config", digest)
+        self.refresh()
+
     @property
     def gain_control_mode(self):
         """gain_control_mode: Mode of receive path AGC. Options are:
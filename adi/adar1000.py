@@ -4,6 +4,7 @@
 
 from math import pi, sin
 
+import numpy as np
 from adi.attribute import attribute
 from adi.context_manager import context_manager
 
@@ -66,6 +67,8 @@ class adar1000(attribute, context_manager):
 
     _device_name = ""
     _BIAS_CODE_TO_VOLTAGE_SCALE = -0.018824
+    _PHASE_STEP = 360 / 128
+    _BEAM_STATES = 121
 
     class adar1000_channel:
         """Class for each channel of the ADAR1000. This class is not meant
@@ -201,6 +204,7 @@ class adar1000(attribute, context_manager):
             self.adar1000_parent._set_iio_attr(
                 f"voltage{self.adar1000_channel}", "attenuation", False, 1 - int(value)
             )
+            self.adar1000_parent._gain_codes[False][self.adar1000_channel] = None
 
         @property
         def rx_beam_state(self):
@@ -248,6 +252,7 @@ class adar1000(attribute, context_manager):
             self.adar1000_parent._set_iio_attr(
                 f"voltage{self.adar1000_channel}", "hardwaregain", False, value
             )
+            self.adar1000_parent._gain_codes[False][self.adar1000_channel] = None
 
         @property
         def rx_phase(self):
@@ -262,6 +267,7 @@ class adar1000(attribute, context_manager):
             self.adar1000_parent._set_iio_attr(
                 f"voltage{self.adar1000_channel}", "phase", False, value
             )
+            self.adar1000_parent._phase_codes[False][self.adar1000_channel] = None
 
         @property
         def tx_attenuator(self):
@@ -279,6 +285,7 @@ class adar1000(attribute, context_manager):
             self.adar1000_parent._set_iio_attr(
                 f"voltage{self.adar1000_channel}", "attenuation", True, 1 - int(value)
             )
+            self.adar1000_parent._gain_codes[True][self.adar1000_channel] = None
 
         @property
         def tx_beam_state(self):
@@ -326,6 +333,7 @@ class adar1000(attribute, context_manager):
             self.adar1000_parent._set_iio_attr(
                 f"voltage{self.adar1000_channel}", "hardwaregain", True, value
             )
+            self.adar1000_parent._gain_codes[True][self.adar1000_channel] = None
 
         @property
         def tx_phase(self):
@@ -340,6 +348,7 @@ class adar1000(attribute, context_manager):
             self.adar1000_parent._set_iio_attr(
                 f"voltage{self.adar1000_channel}", "phase", True, value
             )
+            self.adar1000_parent._phase_codes[True][self.adar1000_channel] = None
 
         """ Public Methods """
 
@@ -433,6 +442,16 @@ class adar1000(attribute, context_manager):
                     if map_value == element_number:
                         element_rows_cols[element_number] = (r, c)
 
+        # Last phase shifter codes written by _write_phases, and gain with
+        # attenuator states written by _write_gains, per direction
+        self._phase_codes = {False: [None] * 4, True: [None] * 4}
+        self._gain_codes = {False: [None] * 4, True: [None] * 4}
+
+        # Channel values saved to beam memory positions by _save_beam, and
+        # the common beam positions loaded, per direction
+        self._beam_codes = {False: {}, True: {}}
+        self._beam_state = {False: None, True: None}
+
         # Create the channel instances
         self._channels = []
         for i in range(4):
@@ -560,7 +579,7 @@ class adar1000(attribute, context_manager):
         Get/Set the CHX_RAM_BYPASS bits to use either a common beam state for all channels set by registers 0x39
         and 0x3A, or individual beam states set by registers 0x3D to 0x44.
         """
-        self._set_iio_dev_attr_str("bias_enable", int(value), self._ctrl)
+        self._set_iio_dev_attr_str("common_mem_enable", int(value), self._ctrl)
 
     @property
     def common_rx_beam_state(self):
@@ -572,7 +591,9 @@ class adar1000(attribute, context_manager):
     def common_rx_beam_state(self, value):
         """Get/Set the Rx beam position used by RAM when all
         channels point to a common state. Valid states are 0-120."""
+        self._beam_state[False] = None
         self._set_iio_dev_attr_str("static_rx_beam_pos_load", value, self._ctrl)
+        self._beam_state[False] = int(value)
 
     @property
     def common_tx_beam_state(self):
@@ -584,7 +605,9 @@ class adar1000(attribute, context_manager):
     def common_tx_beam_state(self, value):
         """Get/Set the Tx beam position used by RAM when all
         channels point to a common state. Valid states are 0-120."""
+        self._beam_state[True] = None
         self._set_iio_dev_attr_str("static_tx_beam_pos_load", value, self._ctrl)
+        self._beam_state[True] = int(value)
 
     @property
     def external_tr_pin(self):
@@ -1146,6 +1169,85 @@ class adar1000(attribute, context_manager):
     def reset(self):
         """ Reset ADAR1000 to default settings """
         self._set_iio_dev_attr("reset", 1, self._ctrl)
+        self._phase_codes = {False: [None] * 4, True: [None] * 4}
+        self._gain_codes = {False: [None] * 4, True: [None] * 4}
+        self._beam_codes = {False: {}, True: {}}
+        self._beam_state = {False: None, True: None}
+
+    def _write_phases(self, phases, output, channels=range(4)):
+        """Write the phases of channels, all four by default, rounded to the
+        phase shifter resolution. Channels already set to the same phase are
+        skipped. Returns True if any channel was written"""
+        codes = np.round(np.mod(phases, 360) / self._PHASE_STEP).astype(int) % 128
+        last = self._phase_codes[output]
+        written = False
+        for channel, code in zip(channels, codes):
+            if last[channel] == code:
+                continue
+            self._set_iio_attr(
+                f"voltage{channel}",
+                "phase",
+                output,
+                "{:.4f}".format(code * self._PHASE_STEP),
+            )
+            last[channel] = code
+            written = True
+        return written
+
+    def _write_gains(self, gains, attenuators, output, channels=range(4)):
+        """Write the gains and attenuator states of channels, all four by
+        default. Channels already set to the same values are skipped.
+        Returns True if any channel was written"""
+        last = self._gain_codes[output]
+        written = False
+        for channel, gain, attenuator in zip(channels, gains, attenuators):
+            state = (int(gain), bool(attenuator))
+            if last[channel] == state:
+                continue
+            last[channel] = None
+            self._set_iio_attr(f"voltage{channel}", "hardwaregain", output, state[0])
+            self._set_iio_attr(
+                f"voltage{channel}", "attenuation", output, 1 - int(state[1])
+            )
+            last[channel] = state
+            written = True
+        return written
+
+    def _save_beam(self, state, gains, attenuators, phases, output):
+        """Save the gains, attenuator states and phases of the four channels
+        to a beam memory position, with phases rounded to the phase shifter
+        resolution. Channels already saved with the same values are skipped.
+        Returns the number of channels written"""
+        codes = np.round(np.mod(phases, 360) / self._PHASE_STEP).astype(int) % 128
+        saved = self._beam_codes[output]
+        written = 0
+        for channel, gain, attenuator, code in zip(
+            self.channels, gains, attenuators, codes
+        ):
+            key = (state, channel.adar1000_channel)
+            entry = (int(gain), bool(attenuator), int(code))
+            if saved.get(key) == entry:
+                continue
+            saved.pop(key, None)
+            save = channel.save_tx_beam if output else channel.save_rx_beam
+            save(state, entry[1], entry[0], "{:.4f}".format(code * self._PHASE_STEP))
+            saved[key] = entry
+            written += 1
+        if written and self._beam_state[output] == state:
+            # The loaded position changed, load it again on next selection
+            self._beam_state[output] = None
+        return written
+
+    def _load_beam(self, state, output):
+        """Load a common beam position unless it is already loaded. Returns
+        True if it was written"""
+        if self._beam_state[output] == state:
+            return False
+        if output:
+            self.common_tx_beam_state = state
+        else:
+            self.common_rx_beam_state = state
+        return True
 
     def save_rx_bias(
         self,
@@ -1284,6 +1386,9 @@ class adar1000_array(context_manager):
     """
 
     _device_name = ""
+    __element_layout = None
+    __codebooks = None
+    __beam_mem = False
 
     def __init__(
         self,
@@ -1578,6 +1683,16 @@ class adar1000_array(context_manager):
         """ Get the Tx elevation phi angle for the array in degrees """
         return self._tx_elevation_phi
 
+    def __layout(self):
+        """Devices with the rows and columns of their channels as arrays of
+        shape (devices, 4), computed once"""
+        if self.__element_layout is None:
+            devices = list(self.devices.values())
+            rows = np.array([[ch.row for ch in dev.channels] for dev in devices])
+            columns = np.array([[ch.column for ch in dev.channels] for dev in devices])
+            self.__element_layout = (devices, rows, columns)
+        return self.__element_layout
+
     def _steer(self, rx_or_tx, azimuth, elevation):
         """Steer the array
         parameters:
@@ -1607,22 +1722,115 @@ class adar1000_array(context_manager):
             self._tx_azimuth_phi = azimuth_phi
             self._tx_elevation_phi = elevation_phi
 
-        # Steer the elements in the array
-        for element in self.elements.values():
-            # Calculate the row and column phases
-            column_phase = element.column * azimuth_phi
-            row_phase = element.row * elevation_phi
-
+        # Steer the elements in the array, latching only devices that changed
+        devices, rows, columns = self.__layout()
+        self._use_beam_mem(False)
+        phases = columns * azimuth_phi + rows * elevation_phi
+        for device, device_phases in zip(devices, phases):
             if rx_or_tx == "rx":
-                element.rx_phase = column_phase + row_phase
+                if device._write_phases(device_phases, False):
+                    device.latch_rx_settings()
             else:
-                element.tx_phase = column_phase + row_phase
+                if device._write_phases(device_phases, True):
+                    device.latch_tx_settings()
+
+    def _use_beam_mem(self, enable):
+        """Switch all devices between beam memory and SPI control of their
+        gains and phases. Loading a memory beam overwrites the working
+        registers, so switching back to SPI forgets the last written codes
+        and the next write reaches and latches every device"""
+        if self.__beam_mem == enable:
+            return
+        for device in self.devices.values():
+            device.beam_mem_enable = enable
+            if enable:
+                device.common_mem_enable = True
+            else:
+                device._phase_codes = {False: [None] * 4, True: [None] * 4}
+                device._gain_codes = {False: [None] * 4, True: [None] * 4}
+        self.__beam_mem = enable
 
-        # Latch in the new phases
-        if rx_or_tx == "rx":
-            self.latch_rx_settings()
+    def __codebook(self, output):
+        if self.__codebooks is None:
+            self.__codebooks = {False: {}, True: {}}
+        return self.__codebooks[output]
+
+    @staticmethod
+    def __beam_key(azimuth, elevation):
+        return (round(float(azimuth), 6), round(float(elevation), 6))
+
+    def _save_codebook(self, rx_or_tx, azimuths, elevations, gain):
+        """Save a grid of beams to the beam memories of all devices
+        parameters:
+            rx_or_tx: string
+                Sets which memories are written, Rx or Tx.
+            azimuths: list[float]
+                Beam angles in degrees for the horizontal direction
+            elevations: list[float]
+                Beam angles in degrees for the vertical direction
+            gain: int or list[list[int]]
+                Gain of all elements, or of each element laid out like
+                element_map. Elements with a gain of 0 are attenuated
+        """
+        output = rx_or_tx.strip().lower() == "tx"
+        azimuths, elevations = np.meshgrid(
+            np.atleast_1d(azimuths), np.atleast_1d(elevations), indexing="ij"
+        )
+        beams = list(zip(azimuths.ravel(), elevations.ravel()))
+        if len(beams) > adar1000._BEAM_STATES:
+            raise Exception(
+                f"Codebook of {len(beams)} beams does not fit in "
+                f"{adar1000._BEAM_STATES} beam memory positions"
+            )
+
+        devices, rows, columns = self.__layout()
+        gains = np.broadcast_to(np.asarray(gain), np.shape(self.element_map))
+        gains = gains[rows, columns]
+        codebook = self.__codebook(output)
+        codebook.clear()
+        for state, (azimuth, elevation) in enumerate(beams):
+            azimuth_phi, elevation_phi = self.calculate_phi(azimuth, elevation)
+            phases = columns * azimuth_phi + rows * elevation_phi
+            for device, device_gains, device_phases in zip(devices, gains, phases):
+                device._save_beam(
+                    state, device_gains, device_gains == 0, device_phases, output
+                )
+            codebook[self.__beam_key(azimuth, elevation)] = state
+        return len(beams)
+
+    def _select_beam(self, rx_or_tx, azimuth, elevation):
+        """Point the array to a beam of the codebook
+        parameters:
+            rx_or_tx: string
+                Sets which beam is selected, Rx or Tx.
+            azimuth: float
+                Beam angle in degrees for the horizontal direction
+            elevation: float
+                Beam angle in degrees for the vertical direction
+        """
+        output = rx_or_tx.strip().lower() == "tx"
+        state = self.__codebook(output).get(self.__beam_key(azimuth, elevation))
+        if state is None:
+            raise Exception(
+                f"No beam at azimuth {azimuth} and elevation {elevation} in the "
+                f"{'Tx' if output else 'Rx'} codebook"
+            )
+
+        self._use_beam_mem(True)
+        for device in self.devices.values():
+            device._load_beam(state, output)
+
+        azimuth_phi, elevation_phi = self.calculate_phi(azimuth, elevation)
+        if output:
+            self._tx_azimuth = azimuth
+            self._tx_elevation = elevation
+            self._tx_azimuth_phi = azimuth_phi
+            self._tx_elevation_phi = elevation_phi
         else:
-            self.latch_tx_settings()
+            self._rx_azimuth = azimuth
+            self._rx_elevation = elevation
+            self._rx_azimuth_phi = azimuth_phi
+            self._rx_elevation_phi = elevation_phi
 
     """ Public Methods """
 
@@ -1697,3 +1905,73 @@ class adar1000_array(context_manager):
         """
 
         self._steer("tx", azimuth, elevation)
+
+    def save_rx_codebook(self, azimuths, elevations=0, gain=127):
+        """Save a grid of Rx beams to the beam memories of the devices, so
+        select_rx_beam can switch between them by writing only the beam
+        position of each device. Beam positions already saved with the same
+        values are not written again.
+
+        parameters:
+            azimuths: float or list[float]
+                Beam angles in degrees for the horizontal direction.
+            elevations: float or list[float]
+                Beam angles in degrees for the vertical direction.
+            gain: int or list[list[int]]
+                Gain of all elements, or of each element laid out like
+                element_map. Elements with a gain of 0 are attenuated.
+
+        returns: type=int
+            Number of beams in the codebook, at most 121
+        """
+
+        return self._save_codebook("rx", azimuths, elevations, gain)
+
+    def save_tx_codebook(self, azimuths, elevations=0, gain=127):
+        """Save a grid of Tx beams to the beam memories of the devices, so
+        select_tx_beam can switch between them by writing only the beam
+        position of each device. Beam positions already saved with the same
+        values are not written again.
+
+        parameters:
+            azimuths: float or list[float]
+                Beam angles in degrees for the horizontal direction.
+            elevations: float or list[float]
+                Beam angles in degrees for the vertical direction.
+            gain: int or list[list[int]]
+                Gain of all elements, or of each element laid out like
+                element_map. Elements with a gain of 0 are attenuated.
+
+        returns: type=int
+            Number of beams in the codebook, at most 121
+        """
+
+        return self._save_codebook("tx", azimuths, elevations, gain)
+
+    def select_rx_beam(self, azimuth, elevation=0):
+        """Point the Rx array to a beam saved with save_rx_codebook. The
+        devices are switched to beam memory control, until the next
+        steer_rx or steer_tx.
+
+        parameters:
+            azimuth: float
+                Beam angle in degrees for the horizontal direction.
+            elevation: float
+                Beam angle in degrees for the vertical direction.
+        """
+
+        self._select_beam("rx", azimuth, elevation)
+
+    def select_tx_beam(self, azimuth, elevation=0):
+        """Point the Tx array to a beam saved with save_tx_codebook. The
+        devices are switched to beam memory control, until the next
+        steer_rx or steer_tx.
+
+        parameters:
+            azimuth: float
+                Beam angle in degrees for the horizontal direction.
+            elevation: float
+                Beam angle in degrees for the vertical direction.
+        """
+
+        self._select_beam("tx", azimuth, elevation)
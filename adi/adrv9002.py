@@ -8,6 +8,7 @@ import iio
 
 from adi.context_manager import context_manager
 from adi.obs import obs, remap, tx_two
+from adi.profile_cache import profiles
 from adi.rx_tx import rx_tx
 
 
@@ -40,6 +41,8 @@ class adrv9002(rx_tx, context_manager):
     _tx_channel_names = ["voltage0", "voltage1"]
     _tx2_channel_names = ["voltage0", "voltage1"]
     _device_name = ""
+    # The context timeout is raised to load profiles, so it is not shared
+    _ctx_shared = False
 
     def __init__(self, uri=""):
 
@@ -89,36 +92,52 @@ class adrv9002(rx_tx, context_manager):
 
         rx_tx.__init__(self)
 
-    def write_stream_profile(self, stream, profile):
-        """Load a new profile and stream on the device"""
-        with open(stream, "rb") as file:
-            data = file.read()
-            data = c_char_p(data)
-            attr_encode = "stream_config".encode("ascii")
-            iio._d_write_attr(self._ctrl._device, attr_encode, data)
-        with open(profile, "r") as file:
-            data = file.read()
-        self._set_iio_dev_attr_str("profile_config", data)
-
-    def write_profile(self, value):
+    def __load(self, attr, path, binary=False, force=False):
+        """Load a file into a device attribute unless its contents are the
+        last loaded there. Returns True when the file was written"""
+        digest, data = profiles.read(path, binary)
+        if not force and profiles.is_loaded(self._ctx, self._ctrl, attr, digest):
+            return False
+        profiles.set_loaded(self._ctx, self._ctrl, attr, None)
+        if binary:
+            attr_encode = attr.encode("ascii")
+            iio._d_write_attr(self._ctrl._device, attr_encode, c_char_p(data))
+        else:
+            self._set_iio_dev_attr_str(attr, data)
+        profiles.set_loaded(self._ctx, self._ctrl, attr, digest)
+        return True
+
+    def write_stream_profile(self, stream, profile, force=False):
+        """Load a new profile and stream on the device
+            Files already loaded with the same contents are skipped unless
+            force is True, which reloads them, for example to reset the
+            device. See adi.profile_cache.profiles to preload files.
+        """
+        self.write_stream(stream, force)
+        self.write_profile(profile, force)
+
+    def write_profile(self, value, force=False):
         """Load a new profile on the device
             Stream related to profile should be loaded first.
             Please see driver documentation about profile generation.
+            A profile with the same contents as the last loaded is skipped
+            unless force is True.
         """
-        with open(value, "r") as file:
-            data = file.read()
-        self._set_iio_dev_attr_str("profile_config", data)
+        if self.__load("profile_config", value, force=force):
+            self.refresh()
 
-    def write_stream(self, value):
+    def write_stream(self, value, force=False):
         """Load a new stream on the device
             Stream becomes active once accompanying profile is loaded
             Please see driver documentation about stream generation.
+            A stream with the same contents as the last loaded is skipped
+            unless force is True.
         """
-        with open(value, "rb") as file:
-            data = file.read()
-            data = c_char_p(data)
-            attr_encode = "stream_config".encode("ascii")
-            iio._d_write_attr(self._ctrl._device, attr_encode, data)
+        if not self.__load("stream_config", value, binary=True, force=force):
+            return False
+        # The profile must be loaded again for the new stream to be active
+        profiles.set_loaded(self._ctx, self._ctrl, "profile_config", None)
+        return True
 
     # we cannot really get the profile. The driver will just throw EPERM
     profile = property(None, write_profile)
@@ -5,6 +5,7 @@
 from adi.context_manager import context_manager
 from adi.jesd import jesd as jesdadi
 from adi.obs import obs
+from adi.profile_cache import profiles
 from adi.rx_tx import rx_tx
 from adi.sync_start import sync_start
 
@@ -27,6 +28,8 @@ class adrv9009(rx_tx, context_manager, sync_start):
     _tx_channel_names = ["voltage0", "voltage1", "voltage2", "voltage3"]
     _obs_channel_names = ["voltage0_i", "voltage0_q"]
     _device_name = ""
+    # The context timeout is raised to load profiles, so it is not shared
+    _ctx_shared = False
 
     def __init__(self, uri="", jesd_monitor=False, jesd=None):
 
@@ -54,18 +57,40 @@ class adrv9009(rx_tx, context_manager, sync_start):
 
     @property
     def profile(self):
-        """Load profile file. Provide path to profile file to attribute"""
+        """Load profile file. Provide path to profile file to attribute.
+        A profile with the same contents as the last loaded is skipped,
+        use write_profile with force to reload it"""
         return self._get_iio_dev_attr("profile_config")
 
     @profile.setter
     def profile(self, value):
-        with open(value, "r") as file:
-            data = file.read()
+        self.write_profile(value)
+
+    def write_profile(self, value, force=False):
+        """Load a profile file on the device
+
+        parameters:
+            value: type=string
+                Path of the profile file
+            force: type=bool
+                Load the profile even when its contents are the last loaded,
+                for example to reset the device
+        """
+        digest, data = profiles.read(value)
         # Apply profiles in specific order if multiple phys found
         phys = [p for p in self.__dict__.keys() if "_ctrl" in p]
         phys = sorted(phys)
-        for phy in phys[1:] + [phys[0]]:
-            self._set_iio_dev_attr_str("profile_config", data, self.getattr(phy))
+        phys = [getattr(self, phy) for phy in phys[1:] + [phys[0]]]
+        if not force and all(
+            profiles.is_loaded(self._ctx, phy, "profile_config", digest) for phy in phys
+        ):
+            return
+        for phy in phys:
+            profiles.set_loaded(self._ctx, phy, "profile_config", None)
+        for phy in phys:
+            self._set_iio_dev_attr_str("profile_config", data, phy)
+            profiles.set_loaded(self._ctx, phy, "profile_config", digest)
+        self.refresh()
 
     @property
     def frequency_hopping_mode(self):
@@ -9,9 +9,10 @@ from typing import List
 from adi.adrv9009_zu11eg import adrv9009_zu11eg
 from adi.adrv9009_zu11eg_fmcomms8 import adrv9009_zu11eg_fmcomms8
 from adi.jesd import jesd as jesd_api
+from adi.multi_som import multi_som
 
 
-class adrv9009_zu11eg_multi(object):
+class adrv9009_zu11eg_multi(multi_som):
     """ADRV9009-ZU11EG Multi-SOM Manager
 
     parameters:
@@ -84,7 +85,7 @@ class adrv9009_zu11eg_multi(object):
                 )
 
         for dev in self.secondaries + [self.primary]:
-            dev._rxadc.set_kernel_buffers_count(1)
+            dev.rx_kernel_buffers_count = 1
 
     def reinitialize(self):
         """reinitialize: reinitialize all transceivers"""
@@ -315,19 +316,23 @@ class adrv9009_zu11eg_multi(object):
             dev._clock_chip_carrier.reg_write(0xCC + offs, int(digital) & 0x1F)
 
     def __rx_dma_arm(self):
-        for dev in self.secondaries + [self.primary]:
+        def arm(dev):
             if self._dma_show_arming:
                 print("--DMA ARMING--", dev.uri)
             dev.rx_sync_start = "arm"
             if self._dma_show_arming:
                 print("\n--DMA ARMED--", dev.uri)
 
+        self._for_all_devs(arm, self.secondaries + [self.primary])
+
     def __dds_sync_enable(self, enable):
-        for dev in self.secondaries + [self.primary]:
+        def arm(dev):
             if self._dma_show_arming:
                 print("--DAC SYNC ARMING--", dev.uri)
             dev.tx_sync_start = "arm"
 
+        self._for_all_devs(arm, self.secondaries + [self.primary])
+
     def sysref_request(self):
         """sysref_request: Sysref request for parent HMC7044"""
         if self._request_sysref_carrier:
@@ -399,9 +404,7 @@ class adrv9009_zu11eg_multi(object):
                     self.__read_jesd_status()
                     self.__read_jesd_link_status()
 
-                for dev in [self.primary] + self.secondaries:
-                    dev.rx_destroy_buffer()
-                    dev._rx_init_channels()
+                self._for_all_devs(self._rx_recreate_buffer)
                 return
             except:  # noqa: E722
                 print("Re-initializing due to lock-up")
@@ -412,6 +415,10 @@ class adrv9009_zu11eg_multi(object):
         """Receive data from multiple hardware buffers for each channel index in
         rx_enabled_channels of each child object (primary,secondaries[indx]).
 
+        Devices are armed, set up and refilled in parallel, one worker per
+        context. With rx_reuse_buffers set, buffers from the previous capture
+        are re-armed instead of recreated.
+
         returns: type=numpy.array or list of numpy.array
             An array or list of arrays when more than one receive channel
             is enabled containing samples from a channel or set of channels.
@@ -422,16 +429,13 @@ class adrv9009_zu11eg_multi(object):
             self._rx_initialized = True
         data = []
         self.__rx_dma_arm()
-        # Recreate all buffers
-        for dev in [self.primary] + self.secondaries:
-            dev.rx_destroy_buffer()
-            dev._rx_init_channels()
+        self._rx_prepare_buffers()
 
         if self._resync_tx:
             self.__dds_sync_enable(1)
 
         self.sysref_request()
 
-        for dev in [self.primary] + self.secondaries:
-            data += dev.rx()
+        for samples in self._for_all_devs(lambda dev: dev.rx()):
+            data += samples
         return data
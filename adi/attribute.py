@@ -2,10 +2,57 @@
 #
 # SPDX short identifier: ADIBSD
 
+import asyncio
+import functools
+import math
 import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+_context_workers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_context_workers_lock = threading.Lock()
+
+
+def context_worker(key):
+    """Get the single thread worker used for blocking I/O on an IIO context
+
+    All asynchronous calls on objects sharing a context are run on the same
+    worker, so they are serialized, while calls on different contexts run
+    in parallel.
+
+    parameters:
+        key: type=iio.Context
+            Context (or owning object when no context is available)
+    """
+    with _context_workers_lock:
+        worker = _context_workers.get(key)
+        if worker is None:
+            worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pyadi-iio-ctx"
+            )
+            _context_workers[key] = worker
+        return worker
 
 
 def get_numbers(s):
+    # Plain numbers are parsed directly, other strings use the regex.
+    # Python accepts "_" separators and "inf"/"nan" which the regex does not
+    if "_" not in s:
+        try:
+            return int(s)
+        except ValueError:
+            pass
+        try:
+            v = float(s)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(v):
+                return int(v) if int(v) == v else v
     v = re.findall(r"[-+]?[.]?[\d]+(?:,\d\d\d)*[\.]?\d*(?:[eE][-+]?\d+)?", s)
     v = [float(i) for i in v]
     if len(v) == 1:
@@ -15,7 +62,417 @@ def get_numbers(s):
     return v
 
 
+def get_number_list(s):
+    """Parse a space separated list of numbers, as used by *_available and
+    *_path_rates attributes, into a list of floats. The list can be enclosed
+    in brackets and entries can have a "NAME:" prefix"""
+    tokens = [
+        t.rpartition(":")[2] for t in s.replace("[", " ").replace("]", " ").split()
+    ]
+    if "_" not in s:
+        try:
+            v = np.array(tokens, dtype=np.float64)
+        except ValueError:
+            pass
+        else:
+            if np.isfinite(v).all():
+                return v.tolist()
+    v = get_numbers(s)
+    return [float(v)] if not isinstance(v, list) else v
+
+
+def _to_int(s):
+    try:
+        return int(s)
+    except ValueError:
+        return int(get_numbers(s))
+
+
+def _to_float(s):
+    try:
+        return float(s)
+    except ValueError:
+        return float(get_numbers(s))
+
+
+def _context_key(ctrl):
+    """Context owning an IIO device, used to group I/O per context"""
+    ctx = getattr(ctrl, "_ctx", None)
+    return ctx if ctx is not None else ctrl
+
+
+def _device_key(ctrl):
+    """Stable key of an IIO device. find_device returns a new wrapper on
+    every call, so devices are identified by context and device ID"""
+    return (_context_key(ctrl), getattr(ctrl, "id", ctrl))
+
+
+class attribute_batch(object):
+    """Attribute transaction collecting writes and reads for one flush
+
+    Created by attribute.batch(). While active, attribute writes of the
+    owning object are queued instead of sent to hardware. Reads of queued
+    attributes return the queued value and other reads are passed through,
+    so they return hardware values from before the queued writes. On exit
+    the queued writes are flushed, followed by reads queued with read().
+    Writes are applied in program order, so attributes selecting what a
+    later write applies to, like an NCO index, keep working. Only
+    consecutive writes to the same attribute are coalesced. Operations on
+    different IIO contexts are flushed in parallel on the worker thread of
+    each context.
+
+    parameters:
+        owner: type=adi.attribute.attribute
+            Object whose attribute writes are collected
+        raise_errors: type=bool
+            Raise an exception after the flush when any operation failed.
+            Failures are always available in errors
+    """
+
+    def __init__(self, owner, raise_errors=True):
+        self._owner = owner
+        self._raise_errors = raise_errors
+        self._writes = []
+        self._reads = []
+        self._depth = 0
+        self.results = {}
+        self.errors = {}
+
+    @staticmethod
+    def _label(key):
+        """Readable name of a write, (device, channel, attribute)"""
+        ctrl, channel_name, output, attr_name = key
+        if output == "debug":
+            channel_name = "debug"
+        return (getattr(ctrl, "name", None), channel_name, attr_name)
+
+    @staticmethod
+    def _same(key, other):
+        return key[1:] == other[1:] and _device_key(key[0]) == _device_key(other[0])
+
+    def _queue(self, key, value):
+        # Coalesce only with the previous write, others keep program order
+        if self._writes and self._same(self._writes[-1][0], key):
+            self._writes[-1] = (key, value)
+        else:
+            self._writes.append((key, value))
+
+    def _pending(self, key):
+        """Last queued value of an attribute or None when not queued"""
+        for queued, value in reversed(self._writes):
+            if self._same(queued, key):
+                return value
+        return None
+
+    def read(self, name):
+        """Queue a property read. The value is stored in results[name] after
+        the flush
+
+        parameters:
+            name: type=string
+                Name of the property to read, for example "rx_lo"
+        """
+        self._reads.append(name)
+
+    def __run(self, writes, reads):
+        for key, value in writes:
+            try:
+                self._owner._attr_write(key, value)
+                self.results[self._label(key)] = value
+            except Exception as ex:
+                self.errors[self._label(key)] = ex
+        for name in reads:
+            try:
+                self.results[name] = getattr(self._owner, name)
+            except Exception as ex:
+                self.errors[name] = ex
+
+    def flush(self):
+        """Send all queued writes and reads to hardware"""
+        groups = {}
+        for key, value in self._writes:
+            groups.setdefault(_context_key(key[0]), ([], []))[0].append((key, value))
+        if self._reads:
+            ctrl = getattr(self._owner, "_ctrl", None)
+            groups.setdefault(_context_key(ctrl or self._owner), ([], []))[1].extend(
+                self._reads
+            )
+        self._writes = []
+        self._reads = []
+        inline = threading.current_thread().name.startswith("pyadi-iio-ctx")
+        if len(groups) == 1 or inline:
+            # No parallelism to gain, or already on a context worker
+            for writes, reads in groups.values():
+                self.__run(writes, reads)
+        else:
+            futures = [
+                context_worker(ctx).submit(self.__run, writes, reads)
+                for ctx, (writes, reads) in groups.items()
+            ]
+            for future in futures:
+                future.result()
+        if self.errors and self._raise_errors:
+            raise Exception(
+                "Batch failed for: "
+                + ", ".join("{} ({})".format(k, v) for k, v in self.errors.items())
+            )
+        return self.results
+
+    def __enter__(self):
+        self._depth += 1
+        self._owner._attr_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth:
+            return
+        self._owner._attr_batch = None
+        if exc_type is not None:
+            # Drop the transaction when the body failed
+            self._writes = []
+            self._reads = []
+            return
+        self.flush()
+
+
 class attribute:
+    _attr_cache_enabled = False
+    _attr_cache_ttl = None
+    _attr_cache_volatile = (
+        "raw",
+        "input",
+        "processed",
+        "rssi",
+        "temp",
+        "hardwaregain",
+        "lo_locked",
+        "jesd204_fsm_state",
+        "jesd204_fsm_paused",
+        "jesd204_fsm_error",
+    )
+    __attr_cache = None
+    __channel_index = None
+    _attr_batch = None
+
+    @property
+    def attr_cache_enabled(self) -> bool:
+        """attr_cache_enabled: Cache attribute reads
+
+        When True, attribute values read from hardware are remembered per
+        device, channel and attribute, and returned without a read on later
+        accesses. Writes through this class invalidate the written
+        attribute. Writes with side effects on other attributes, or made
+        outside this class, require a call to refresh(). Disabled by default.
+        """
+        return self._attr_cache_enabled
+
+    @attr_cache_enabled.setter
+    def attr_cache_enabled(self, value: bool):
+        self._attr_cache_enabled = bool(value)
+        self.refresh()
+
+    @property
+    def attr_cache_ttl(self):
+        """attr_cache_ttl: Seconds a cached attribute value stays valid.
+        None keeps values until invalidated (default)"""
+        return self._attr_cache_ttl
+
+    @attr_cache_ttl.setter
+    def attr_cache_ttl(self, value):
+        if value is not None and value < 0:
+            raise ValueError("attr_cache_ttl must be None or non-negative")
+        self._attr_cache_ttl = value
+
+    @property
+    def attr_cache_volatile(self):
+        """attr_cache_volatile: Names of attributes that are never cached,
+        such as raw values, temperatures, RSSI, gains changed by AGC and LO
+        lock status"""
+        return list(self._attr_cache_volatile)
+
+    @attr_cache_volatile.setter
+    def attr_cache_volatile(self, value):
+        self._attr_cache_volatile = tuple(value)
+
+    def refresh(self, attr_names=None):
+        """Invalidate cached attribute values so they are read again
+
+        parameters:
+            attr_names: type=list[string]
+                Names of the attributes to invalidate. All are invalidated
+                when None
+        """
+        if self.__attr_cache is None:
+            return
+        if attr_names is None:
+            self.__attr_cache.clear()
+            return
+        if isinstance(attr_names, str):
+            attr_names = [attr_names]
+        for key in [k for k in self.__attr_cache if k[-1] in attr_names]:
+            del self.__attr_cache[key]
+
+    @staticmethod
+    def __cache_key(key):
+        """Cache key of an attribute, with the device replaced by its stable
+        key"""
+        return (_device_key(key[0]),) + tuple(key[1:])
+
+    def __cache_get(self, key):
+        """Cached value for key or None if not cached or expired"""
+        if not self._attr_cache_enabled or self.__attr_cache is None:
+            return None
+        key = self.__cache_key(key)
+        entry = self.__attr_cache.get(key)
+        if entry is None:
+            return None
+        value, stamp = entry
+        if self._attr_cache_ttl is not None:
+            if time.monotonic() - stamp > self._attr_cache_ttl:
+                del self.__attr_cache[key]
+                return None
+        return value
+
+    def __cache_put(self, key, value):
+        if not self._attr_cache_enabled or key[-1] in self._attr_cache_volatile:
+            return
+        if self.__attr_cache is None:
+            self.__attr_cache = {}
+        self.__attr_cache[self.__cache_key(key)] = (value, time.monotonic())
+
+    def __cache_invalidate(self, key):
+        if self.__attr_cache is not None:
+            self.__attr_cache.pop(self.__cache_key(key), None)
+
+    def __cached_read(self, key, read):
+        if self._attr_batch is not None:
+            value = self._attr_batch._pending(key)
+            if value is not None:
+                return value
+        value = self.__cache_get(key)
+        if value is None:
+            value = read()
+            self.__cache_put(key, value)
+        return value
+
+    def _find_channel(self, channel_name, output=False, _ctrl=None):
+        """Find a channel by ID or name
+
+        The channels of a device are indexed on first use, so later lookups
+        are dictionary accesses instead of searches through libiio. Indexes
+        are kept per device ID, so lookups through another wrapper of the
+        same device, as returned by find_device, share them.
+
+        parameters:
+            channel_name: type=string
+                ID or name of the channel
+            output: type=bool
+                Set to True to search for an output channel
+            _ctrl: type=iio.Device
+                Device of the channel. Defaults to the control device
+
+        returns: type=iio.Channel
+            The channel, or None when not found
+        """
+        _ctrl = _ctrl or self._ctrl
+        if self.__channel_index is None:
+            # Per context, so indexes of a replaced context are released
+            self.__channel_index = weakref.WeakKeyDictionary()
+        ctx, key = _device_key(_ctrl)
+        indexes = self.__channel_index.setdefault(ctx, {})
+        index = indexes.get(key)
+        if index is None:
+            index = {}
+            channels = _ctrl.channels
+            for chan in channels:
+                index[(chan.id, chan.output)] = chan
+            for chan in channels:
+                if chan.name:
+                    index.setdefault((chan.name, chan.output), chan)
+            indexes[key] = index
+        return index.get((channel_name, bool(output)))
+
+    def batch(self, raise_errors=True):
+        """Collect attribute writes and reads and flush them together
+
+        Used as a context manager. Writes made inside the block are queued
+        and sent when the block exits. Nested calls join the outer batch.
+
+        parameters:
+            raise_errors: type=bool
+                Raise an exception after the flush when any operation
+                failed. Failures are always available in the errors member
+                of the returned object
+
+        returns: type=adi.attribute.attribute_batch
+            Transaction with results and errors per attribute
+        """
+        if self._attr_batch is not None:
+            return self._attr_batch
+        return attribute_batch(self, raise_errors)
+
+    def _attr_write(self, key, value):
+        """Write an attribute identified by its cache key. Queued instead
+        when a batch is active
+
+        parameters:
+            key: type=tuple
+                (device, channel name, output, attribute name). Channel name
+                and output are None for device attributes, and output is
+                "debug" for debug attributes
+            value: type=string
+                Value to write
+        """
+        if self._attr_batch is not None:
+            self._attr_batch._queue(key, value)
+            return
+        _ctrl, channel_name, output, attr_name = key
+        if output == "debug":
+            attrs = _ctrl.debug_attrs
+        elif channel_name is None:
+            attrs = _ctrl.attrs
+        else:
+            channel = self._find_channel(channel_name, output, _ctrl)
+            if not channel:
+                raise Exception("No channel found with name: " + channel_name)
+            attrs = channel.attrs
+        self.__cache_invalidate(key)
+        attrs[attr_name].value = value
+
+    def _context_worker(self):
+        """Worker serializing blocking I/O for the context of this object"""
+        ctx = getattr(self, "_ctx", None)
+        return context_worker(ctx if ctx is not None else self)
+
+    async def _run_async(self, func, *args, **kwargs):
+        """Run a blocking call on the context worker without blocking the
+        event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._context_worker(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def aget(self, name):
+        """Asynchronously read a property
+
+        parameters:
+            name: type=string
+                Name of the property to read, for example "rx_lo"
+        """
+        return await self._run_async(getattr, self, name)
+
+    async def aset(self, name, value):
+        """Asynchronously write a property
+
+        parameters:
+            name: type=string
+                Name of the property to write, for example "rx_lo"
+            value:
+                Value to write
+        """
+        await self._run_async(setattr, self, name, value)
+
     def _get_iio_attr_str_multi_dev(self, channel_names, attr_name, output, ctrls):
         """ Get the same channel attribute across multiple devices
             which are assumed to be strings
@@ -61,14 +518,8 @@ class attribute:
 
     def _set_iio_attr(self, channel_name, attr_name, output, value, _ctrl=None):
         """ Set channel attribute """
-        if _ctrl:
-            channel = _ctrl.find_channel(channel_name, output)
-        else:
-            channel = self._ctrl.find_channel(channel_name, output)
-        try:
-            channel.attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        _ctrl = _ctrl or self._ctrl
+        self._attr_write((_ctrl, channel_name, output, attr_name), str(value))
 
     def _set_iio_attr_float(self, channel_name, attr_name, output, value, _ctrl=None):
         """ Set channel attribute with float """
@@ -113,13 +564,15 @@ class attribute:
 
     def _get_iio_attr_str(self, channel_name, attr_name, output, _ctrl=None):
         """ Get channel attribute as string """
-        if _ctrl:
-            channel = _ctrl.find_channel(channel_name, output)
-        else:
-            channel = self._ctrl.find_channel(channel_name, output)
-        if not channel:
-            raise Exception("No channel found with name: " + channel_name)
-        return channel.attrs[attr_name].value
+        _ctrl = _ctrl or self._ctrl
+
+        def read():
+            channel = self._find_channel(channel_name, output, _ctrl)
+            if not channel:
+                raise Exception("No channel found with name: " + channel_name)
+            return channel.attrs[attr_name].value
+
+        return self.__cached_read((_ctrl, channel_name, output, attr_name), read)
 
     def _get_iio_attr(self, channel_name, attr_name, output, _ctrl=None):
         """ Get channel attribute as number """
@@ -127,6 +580,22 @@ class attribute:
             self._get_iio_attr_str(channel_name, attr_name, output, _ctrl)
         )
 
+    def _get_iio_attr_int(self, channel_name, attr_name, output, _ctrl=None):
+        """ Get channel attribute as int """
+        return _to_int(self._get_iio_attr_str(channel_name, attr_name, output, _ctrl))
+
+    def _get_iio_attr_float(self, channel_name, attr_name, output, _ctrl=None):
+        """ Get channel attribute as float """
+        return _to_float(
+            self._get_iio_attr_str(channel_name, attr_name, output, _ctrl)
+        )
+
+    def _get_iio_attr_list(self, channel_name, attr_name, output, _ctrl=None):
+        """ Get channel attribute as list of floats """
+        return get_number_list(
+            self._get_iio_attr_str(channel_name, attr_name, output, _ctrl)
+        )
+
     def _get_iio_attr_vec(self, channel_names, attr_name, output, _ctrl=None):
         """ Get channel attributes as list of numbers """
         vals = []
@@ -145,49 +614,48 @@ class attribute:
 
     def _set_iio_dev_attr_str(self, attr_name, value, _ctrl=None):
         """ Set device attribute with string """
-        try:
-            if _ctrl:
-                _ctrl.attrs[attr_name].value = str(value)
-            else:
-                self._ctrl.attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        _dev = _ctrl or self._ctrl
+        self._attr_write((_dev, None, None, attr_name), str(value))
 
     def _get_iio_dev_attr_str(self, attr_name, _ctrl=None):
         """ Get device attribute as string """
-        if _ctrl:
-            return _ctrl.attrs[attr_name].value
-        else:
-            return self._ctrl.attrs[attr_name].value
+        _dev = _ctrl or self._ctrl
+        return self.__cached_read(
+            (_dev, None, None, attr_name), lambda: _dev.attrs[attr_name].value
+        )
 
     def _set_iio_dev_attr(self, attr_name, value, _ctrl=None):
         """ Set device attribute """
         _dev = _ctrl or self._ctrl
-        try:
-            _dev.attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        self._attr_write((_dev, None, None, attr_name), str(value))
 
     def _get_iio_dev_attr(self, attr_name, _ctrl=None):
         """ Set device attribute as number """
         return get_numbers(self._get_iio_dev_attr_str(attr_name, _ctrl))
 
+    def _get_iio_dev_attr_int(self, attr_name, _ctrl=None):
+        """ Get device attribute as int """
+        return _to_int(self._get_iio_dev_attr_str(attr_name, _ctrl))
+
+    def _get_iio_dev_attr_float(self, attr_name, _ctrl=None):
+        """ Get device attribute as float """
+        return _to_float(self._get_iio_dev_attr_str(attr_name, _ctrl))
+
+    def _get_iio_dev_attr_list(self, attr_name, _ctrl=None):
+        """ Get device attribute as list of floats """
+        return get_number_list(self._get_iio_dev_attr_str(attr_name, _ctrl))
+
     def _set_iio_debug_attr_str(self, attr_name, value, _ctrl=None):
         """ Set debug attribute with string """
-        try:
-            if _ctrl:
-                _ctrl.debug_attrs[attr_name].value = str(value)
-            else:
-                self._ctrl.debug_attrs[attr_name].value = str(value)
-        except Exception as ex:
-            raise ex
+        _dev = _ctrl or self._ctrl
+        self._attr_write((_dev, None, "debug", attr_name), str(value))
 
     def _get_iio_debug_attr_str(self, attr_name, _ctrl=None):
         """ Get debug attribute as string """
-        if _ctrl:
-            return _ctrl.debug_attrs[attr_name].value
-        else:
-            return self._ctrl.debug_attrs[attr_name].value
+        _dev = _ctrl or self._ctrl
+        return self.__cached_read(
+            (_dev, None, "debug", attr_name), lambda: _dev.debug_attrs[attr_name].value
+        )
 
     def _get_iio_debug_attr(self, attr_name, _ctrl=None):
         """ Set debug attribute as number """
@@ -29,6 +29,8 @@ class CN0566(adf4159, adar1000_array):
 
     # MWT: Open question: Refactor to nest rather than inherit?
 
+    __elements = None
+
     num_elements = 8
     """Number of antenna elements"""
     phase_step_size = 2.8125  # it is 360/2**number of bits. (number of bits = 6)
@@ -387,6 +389,70 @@ class CN0566(adf4159, adar1000_array):
             self.sdr.rx_hardwaregain_chan0 = int(gain)
             self.sdr.rx_hardwaregain_chan1 = int(gain)
 
+    def __element_layout(self):
+        """Devices with the element indexes of their channels, computed once"""
+        if self.__elements is None:
+            self.__elements = [
+                (dev, np.array([ch.array_element_number - 1 for ch in dev.channels]))
+                for dev in self.devices.values()
+            ]
+        return self.__elements
+
+    def set_rx_gains(self, gains, apply_cal=True):
+        """ Set the gains of all elements at once
+
+        Gains are written only to elements where they changed, and only the
+        ADAR1000s with new gains are latched.
+
+        Parameters
+        ----------
+        gains: type=list
+            Gain of each element, by element index. NaN leaves an element
+            unchanged. Elements with a gain of 0 are also attenuated
+        apply_cal: type=bool
+            Optionally apply gain calibration to all elements.
+        """
+        gains = np.asarray(gains, dtype=float)
+        attenuators = gains == 0
+        if apply_cal is True:
+            gains = gains * np.asarray(self.gcal, dtype=float)
+        self._use_beam_mem(False)
+        for device, elements in self.__element_layout():
+            device_gains = gains[elements]
+            update = np.flatnonzero(~np.isnan(device_gains))
+            if device._write_gains(
+                np.trunc(device_gains[update]),
+                attenuators[elements][update],
+                False,
+                update,
+            ):
+                device.latch_rx_settings()
+
+    def set_rx_phases(self, phases, apply_cal=True):
+        """ Set the phases of all elements at once
+
+        Phases are rounded to phase_step_size, written only to elements
+        where they changed, and only the ADAR1000s with new phases are
+        latched.
+
+        Parameters
+        ----------
+        phases: type=list
+            Phase of each element in degrees, by element index. NaN leaves
+            an element unchanged
+        apply_cal: type=bool
+            Optionally apply phase calibration to all elements.
+        """
+        phases = np.asarray(phases, dtype=float)
+        if apply_cal is True:
+            phases = phases + np.asarray(self.pcal, dtype=float)
+        self._use_beam_mem(False)
+        for device, elements in self.__element_layout():
+            device_phases = phases[elements]
+            update = np.flatnonzero(~np.isnan(device_phases))
+            if device._write_phases(device_phases[update], False, update):
+                device.latch_rx_settings()
+
     def set_all_gain(self, value=127, apply_cal=True):
         """ Set all channel gains to a single value
 
@@ -397,14 +463,7 @@ class CN0566(adf4159, adar1000_array):
         apply_cal: type=bool
             Optionally apply gain calibration to all channels.
         """
-        for i in range(0, 8):
-            if apply_cal is True:
-                self.elements.get(i + 1).rx_gain = int(value * self.gcal[i])
-            else:  # Don't apply gain calibration
-                self.elements.get(i + 1).rx_gain = value
-            # Important if you're relying on elements being truly zero'd out
-            self.elements.get(i + 1).rx_attenuator = not bool(value)
-        self.latch_tx_settings()  # writes 0x01 to reg 0x28
+        self.set_rx_gains(np.full(self.num_elements, value), apply_cal)
 
     def set_chan_gain(self, chan_no: int, gain_val, apply_cal=True):
         """ Setl gain of the individua channel/s.
@@ -418,29 +477,9 @@ class CN0566(adf4159, adar1000_array):
         apply_cal: type=bool
             Optionally apply gain calibration for the selected channel
         """
-        if apply_cal is True:
-            cval = int(gain_val * self.gcal[chan_no])
-            # print(
-            #     "Cal = true, setting channel x to gain y, gcal value: ",
-            #     chan_no,
-            #     ", ",
-            #     cval,
-            #     ", ",
-            #     self.gcal[chan_no],
-            # )
-            self.elements.get(chan_no + 1).rx_gain = cval
-            # print("reading back: ", self.elements.get(chan_no + 1).rx_gain)
-        else:  # Don't apply gain calibration
-            # print(
-            #     "Cal = false, setting channel x to gain y: ",
-            #     chan_no,
-            #     ", ",
-            #     int(gain_val),
-            # )
-            self.elements.get(chan_no + 1).rx_gain = int(gain_val)
-        # Important if you're relying on elements being truly zero'd out
-        self.elements.get(chan_no + 1).rx_attenuator = not bool(gain_val)
-        self.latch_rx_settings()
+        gains = np.full(self.num_elements, np.nan)
+        gains[chan_no] = gain_val
+        self.set_rx_gains(gains, apply_cal)
 
     def set_chan_phase(self, chan_no: int, phase_val, apply_cal=True):
         """ Setl phase of the individua channel/s.
@@ -453,25 +492,10 @@ class CN0566(adf4159, adar1000_array):
             phase_val is the value of phase that you want to set
         apply_cal: type=bool
             Optionally apply phase calibration
-
-        Notes
-        -----
-        Each device has 4 channels but for top level channel numbers are 1 to 8 so took device number as Quotient of
-        channel num div by 4 and channel of that dev is overall chan num minus 4 x that dev number. For e.g:
-        if you want to set gain of channel at index 5 it is 6th channel or 2nd channel of 2nd device so 5//4 = 1
-        i.e. index of 2nd device and (5 - 4*(5//4) = 1 i.e. index of channel
         """
-
-        # list(self.devices.values())[chan_no // 4].channels[(chan_no - (4 * (chan_no // 4)))].rx_phase = phase_val
-        # list(self.devices.values())[chan_no // 4].latch_rx_settings()
-        if apply_cal is True:
-            self.elements.get(chan_no + 1).rx_phase = (
-                phase_val + self.pcal[chan_no]
-            ) % 360.0
-        else:  # Don't apply gain calibration
-            self.elements.get(chan_no + 1).rx_phase = (phase_val) % 360.0
-
-        self.latch_rx_settings()
+        phases = np.full(self.num_elements, np.nan)
+        phases[chan_no] = phase_val
+        self.set_rx_phases(phases, apply_cal)
 
     def set_beam_phase_diff(self, Ph_Diff):
         """ Set phase difference between the adjacent channels of devices
@@ -485,39 +509,96 @@ class CN0566(adf4159, adar1000_array):
         -----
         A public method to sweep the phase value from -180 to 180 deg, calculate phase values of all the channel
         and set them. If we want beam angle at fixed angle you can pass angle value at which you want center lobe
+        """
+        steps = np.rint(Ph_Diff * np.arange(self.num_elements) / self.phase_step_size)
+        self.set_rx_phases(steps * self.phase_step_size)
+
+    def steer_angle(self, Ph_Diff, frequency=None):
+        """ Beam angle for a phase difference between adjacent elements
+
+        Parameters
+        ----------
+        Ph_Diff: type=float or list
+            Phase difference between adjacent elements in degrees
+        frequency: type=float
+            Signal frequency in Hz. Defaults to SignalFreq when set, else lo
 
-        Create an empty list. Based on the device number and channel of that device append phase value to that empty
-        list this creates a list of 4 items. Now write channel of each device, phase values acc to created list
-        values. This is the structural integrity mentioned above.
+        returns:
+            Beam angle in degrees, or an array of them
         """
+        if frequency is None:
+            frequency = getattr(self, "SignalFreq", None) or self.lo
+        wavelength = self.c / frequency
+        ratio = np.radians(Ph_Diff) * wavelength / (2 * np.pi * self.element_spacing)
+        return np.degrees(np.arcsin(np.clip(ratio, -1, 1)))
+
+    def peak_power(self):
+        """ Peak of the spectrum of the summed Rx channels in dBFS, averaged
+        over Averages buffers """
+        win = np.blackman(self.sdr.rx_buffer_size)
+        win /= np.average(win)
+        total = 0.0
+        for _ in range(self.Averages):
+            data = self.sdr.rx()
+            s_sum = np.absolute(np.fft.fft((data[0] + data[1]) * win))
+            s_mag = np.maximum(np.max(s_sum) * 2 / np.sum(win), 10 ** (-15))
+            total += 20 * np.log10(s_mag / (2 ** 12))
+        return total / self.Averages
+
+    def sweep_rx_phases(self, phases, measure=None, apply_cal=True):
+        """ Set each row of a table of element phases and measure the result
+
+        Each step writes only the elements whose phase changed since the
+        previous step.
+
+        Parameters
+        ----------
+        phases: type=list
+            Table of shape (steps, num_elements) in degrees, by element
+            index. NaN leaves an element unchanged
+        measure: type=callable
+            Called with no arguments after each step, returning the value to
+            record. Defaults to peak_power
+        apply_cal: type=bool
+            Optionally apply phase calibration to all elements.
 
-        # j = 0  # j is index of device and device indicate the adar1000 on which operation is currently done
-        # for device in list(self.devices.values()):  # device in dict of all adar1000 connected
-        #     channel_phase_value = []  # channel phase value to be written on ind channel
-        #     for ind in range(0, 4):  # ind is index of current channel of current device
-        #         channel_phase_value.append((((np.rint(Ph_Diff * ((j * 4) + ind) / self.phase_step_size)) *
-        #                                      self.phase_step_size) + self.pcal[((j * 4) + ind)]) % 360)
-        #     j += 1
-        #     i = 0  # i is index of channel of each device
-        #     for channel in device.channels:
-        #         # Set phase depending on the device mode
-        #         if self.device_mode == "rx":
-        #             channel.rx_phase = channel_phase_value[
-        #                 i]  # writes to I and Q registers values according to Table 13-16 from datasheet.
-        #         i = i + 1
-        #     if self.device_mode == "rx":
-        #         device.latch_rx_settings()
-        #     else:
-        #         device.latch_tx_settings()
-        #     # print(channel_phase_value)
-
-        for ch in range(0, 8):
-            self.elements.get(ch + 1).rx_phase = (
-                ((np.rint(Ph_Diff * ch / self.phase_step_size)) * self.phase_step_size)
-                + self.pcal[ch]
-            ) % 360.0
-
-        self.latch_rx_settings()
+        returns:
+            Array of the measured values, one per step
+        """
+        measure = measure or self.peak_power
+        results = []
+        for row in np.atleast_2d(phases):
+            self.set_rx_phases(row, apply_cal)
+            results.append(measure())
+        return np.array(results)
+
+    def beam_sweep(self, phase_diffs=None, measure=None, frequency=None):
+        """ Sweep the beam and measure the received power at each angle
+
+        Parameters
+        ----------
+        phase_diffs: type=list
+            Phase differences between adjacent elements in degrees. Defaults
+            to -180 to 180 in steps of phase_step_size
+        measure: type=callable
+            Called with no arguments at each angle, returning the value to
+            record. Defaults to peak_power
+        frequency: type=float
+            Signal frequency in Hz used for the angles. Defaults to
+            SignalFreq when set, else lo
+
+        returns:
+            Tuple of arrays with the beam angles in degrees and the measured
+            values
+        """
+        if phase_diffs is None:
+            phase_diffs = np.arange(-180, 180, self.phase_step_size)
+        phase_diffs = np.asarray(phase_diffs, dtype=float)
+        steps = np.rint(
+            np.outer(phase_diffs, np.arange(self.num_elements)) / self.phase_step_size
+        )
+        powers = self.sweep_rx_phases(steps * self.phase_step_size, measure)
+        return self.steer_angle(phase_diffs, frequency), powers
 
     def SDR_init(self, SampleRate, TX_freq, RX_freq, Rx_gain, Tx_gain, buffer_size):
         """ Initialize Pluto rev C for operation with the phaser. This is a convenience
@@ -552,9 +633,8 @@ class CN0566(adf4159, adar1000_array):
         ]  # enable Rx1 (voltage0) and Rx2 (voltage1)
         self.sdr.gain_control_mode_chan0 = "manual"  # We must be in manual gain control mode (otherwise we won't see the peaks and nulls!)
         self.sdr.gain_control_mode_chan1 = "manual"  # We must be in manual gain control mode (otherwise we won't see the peaks and nulls!)
-        self.sdr._rxadc.set_kernel_buffers_count(
-            1
-        )  # Default is 4 Rx buffers are stored, but we want to change and immediately measure the result, so buffers=1
+        # Default is 4 Rx buffers are stored, but we want to change and immediately measure the result, so buffers=1
+        self.sdr.rx_kernel_buffers_count = 1
         rx = self.sdr._ctrl.find_channel("voltage0")
         rx.attrs[
             "quadrature_tracking_en"
@@ -2,18 +2,387 @@
 #
 # SPDX short identifier: ADIBSD
 
+import errno
+import json
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
 import iio
 
+# Errors meaning the connection to the context is gone
+_DISCONNECT_ERRNOS = (
+    errno.EPIPE,
+    errno.ECONNRESET,
+    errno.ECONNREFUSED,
+    errno.ENOTCONN,
+    errno.ETIMEDOUT,
+    errno.EHOSTUNREACH,
+    errno.ENODEV,
+    errno.EBADF,
+)
+
+
+class context_pool(object):
+    """Process wide pool of IIO contexts keyed by URI
+
+    When enabled, objects created with the same URI share one context, so a
+    board driven through several classes needs one connection per URI.
+    Contexts are reference counted and dropped when the last user is
+    garbage collected. A context that has not been used for
+    health_check_interval seconds is checked before it is handed out again,
+    and replaced when the connection has been lost.
+
+    Sharing is disabled by default, because state kept in a context is
+    shared too: its timeout, and the enabled channels of its devices when
+    several objects stream from the same device. Classes that change such
+    state, like adrv9002 and adrv9009 which raise the timeout to load
+    profiles, always get their own context.
+
+    parameters:
+        health_check_interval: type=float
+            Seconds after which a pooled context is checked before reuse.
+            None disables health checks
+        enabled: type=bool
+            Share contexts between objects
+    """
+
+    def __init__(self, health_check_interval=5.0, enabled=False):
+        self.health_check_interval = health_check_interval
+        self.enabled = enabled
+        self.__entries = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def _is_alive(ctx):
+        """Check a context by reading an attribute over its connection"""
+        for dev in ctx.devices:
+            for attr in dev.attrs.values():
+                try:
+                    attr.value
+                except OSError as ex:
+                    if ex.errno in _DISCONNECT_ERRNOS:
+                        return False
+                    continue  # Device answered, attribute not readable
+                return True
+        return True
+
+    def acquire(self, uri, owner=None, shared=True) -> iio.Context:
+        """Get the pooled context for a URI, connecting when needed
+
+        parameters:
+            uri: type=string
+                URI of the context
+            owner: type=object
+                Object holding the context. The reference is released when
+                it is garbage collected. When None, release() must be called
+            shared: type=bool
+                Allow the context to be shared. When False, or when the
+                pool is disabled, a new context is returned
+
+        returns: type=iio.Context
+            The shared context
+        """
+        if not self.enabled or not shared:
+            return iio.Context(uri)
+        with self.__lock:
+            entry = self.__entries.get(uri)
+            now = time.monotonic()
+            if entry is not None and self.health_check_interval is not None:
+                if now - entry["checked"] > self.health_check_interval:
+                    if not self._is_alive(entry["ctx"]):
+                        entry["ctx"] = iio.Context(uri)
+                    entry["checked"] = now
+            if entry is None:
+                entry = {"ctx": iio.Context(uri), "refs": 0, "checked": now}
+                self.__entries[uri] = entry
+            entry["refs"] += 1
+            ctx = entry["ctx"]
+        if owner is not None:
+            weakref.finalize(owner, self.release, uri)
+        return ctx
+
+    def release(self, uri):
+        """Drop one reference to the context of a URI
+
+        parameters:
+            uri: type=string
+                URI of the context
+        """
+        with self.__lock:
+            entry = self.__entries.get(uri)
+            if entry is None:
+                return
+            entry["refs"] -= 1
+            if entry["refs"] <= 0:
+                del self.__entries[uri]
+
+    def reconnect(self, uri, stale=None) -> iio.Context:
+        """Replace the pooled context of a URI with a new connection
+
+        Objects holding the previous context keep it until they reconnect.
+
+        parameters:
+            uri: type=string
+                URI of the context
+            stale: type=iio.Context
+                Context known to be disconnected. When the pool already
+                holds a different context for the URI, it is returned
+                instead of connecting again
+
+        returns: type=iio.Context
+            The new context
+        """
+        with self.__lock:
+            entry = self.__entries.get(uri)
+            if entry is not None and stale is not None and entry["ctx"] is not stale:
+                return entry["ctx"]
+            ctx = iio.Context(uri)
+            if entry is not None:
+                entry["ctx"] = ctx
+                entry["checked"] = time.monotonic()
+        return ctx
+
+    def references(self, uri) -> int:
+        """Number of objects using the pooled context of a URI
+
+        parameters:
+            uri: type=string
+                URI of the context
+        """
+        with self.__lock:
+            entry = self.__entries.get(uri)
+            return entry["refs"] if entry else 0
+
+    def clear(self):
+        """Forget all pooled contexts. Contexts in use stay open until their
+        users are garbage collected"""
+        with self.__lock:
+            self.__entries.clear()
+
+
+shared_contexts = context_pool()
+
+
+def _default_discovery_cache():
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache, "pyadi-iio", "discovery.json")
+
+
+class context_discovery(object):
+    """Cached discovery of IIO contexts
+
+    Contexts are scanned once and their URIs, descriptions and device names
+    are kept in an index, which is also saved to disk so later processes
+    can skip the scan. Candidates are opened in parallel to read their
+    device names. A search that fails on cached data rescans once, so
+    newly attached hardware is still found.
+
+    parameters:
+        ttl: type=float
+            Seconds the index stays valid
+        cache_file: type=string
+            Path of the on-disk index. None keeps the index in memory only
+        max_workers: type=int
+            Number of contexts opened in parallel to read device names
+    """
+
+    def __init__(self, ttl=300.0, cache_file="", max_workers=8):
+        self.ttl = ttl
+        self.cache_file = _default_discovery_cache() if cache_file == "" else cache_file
+        self.max_workers = max_workers
+        self.__index = None
+        self.__stamp = 0.0
+        self.__lock = threading.Lock()
+
+    def __is_fresh(self, stamp):
+        return self.ttl is None or time.time() - stamp <= self.ttl
+
+    def __load(self):
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            if self.__is_fresh(data["time"]):
+                self.__index = data["contexts"]
+                self.__stamp = data["time"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def __save(self):
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp = self.cache_file + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump({"time": self.__stamp, "contexts": self.__index}, f)
+            os.replace(tmp, self.cache_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _probe(uri):
+        """Names of the devices of a context, empty if it cannot be opened"""
+        try:
+            return [dev.name for dev in iio.Context(uri).devices]
+        except Exception:
+            return []
+
+    def __probe_all(self):
+        pending = [u for u, e in self.__index.items() if e["devices"] is None]
+        if not pending:
+            return
+        workers = max(1, min(self.max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for uri, names in zip(pending, ex.map(self._probe, pending)):
+                self.__index[uri]["devices"] = names
+        self.__save()
+
+    def scan(self, refresh=False, probe=False) -> dict:
+        """Index of available contexts
+
+        parameters:
+            refresh: type=bool
+                Scan again even if the cached index is still valid
+            probe: type=bool
+                Open contexts not probed yet to read their device names
+
+        returns: type=dict
+            URI to a dict with the context "description" and the list of
+            "devices" names. Devices are None when not probed and empty
+            when the context could not be opened
+        """
+        with self.__lock:
+            if not refresh and self.__index is None:
+                self.__load()
+            if refresh or self.__index is None or not self.__is_fresh(self.__stamp):
+                contexts = iio.scan_contexts()
+                self.__index = {
+                    uri: {"description": desc, "devices": None}
+                    for uri, desc in contexts.items()
+                }
+                self.__stamp = time.time()
+                self.__save()
+            if probe:
+                self.__probe_all()
+            return {uri: dict(entry) for uri, entry in self.__index.items()}
+
+    def find(self, device_names=None, description=None, refresh=False):
+        """Find the URI of a context providing the given devices
+
+        parameters:
+            device_names: type=list[string]
+                Names of devices the context must contain
+            description: type=string
+                Text the context description must contain
+
+        returns: type=string
+            URI of the first matching context, or None
+        """
+        for rescan in [True] if refresh else [False, True]:
+            index = self.scan(rescan, probe=bool(device_names))
+            for uri, entry in index.items():
+                if description and description not in entry["description"]:
+                    continue
+                if device_names and not all(
+                    name in (entry["devices"] or ()) for name in device_names
+                ):
+                    continue
+                return uri
+        return None
+
+    def invalidate(self):
+        """Drop the index, in memory and on disk"""
+        with self.__lock:
+            self.__index = None
+            if self.cache_file:
+                try:
+                    os.remove(self.cache_file)
+                except OSError:
+                    pass
+
+
+discovery = context_discovery()
+
 
 class context_manager(object):
     _uri_auto = "ip:analog"
     _ctx = None
+    _ctx_shared = True
+    _ctx_pooled = False
 
     @property
     def ctx(self) -> iio.Context:
         """IIO Context"""
         return self._ctx
 
+    def _ctx_acquire(self, uri) -> iio.Context:
+        """Get the context for a URI from the shared pool"""
+        self._ctx_uri = uri
+        self._ctx_pooled = shared_contexts.enabled and self._ctx_shared
+        return shared_contexts.acquire(uri, self, self._ctx_shared)
+
+    def _ctx_discover(self, device_names=None, description=None):
+        """Get the context of the URI found by discovery
+
+        A cached URI can be stale, for example when a USB device was
+        plugged in again and got a new address. When the URI does not open,
+        or its context lacks device_names, the index is dropped and the
+        search is repeated once on a fresh scan.
+
+        parameters:
+            device_names: type=list[string]
+                Names of devices the context must contain
+            description: type=string
+                Text the context description must contain
+
+        returns: type=iio.Context
+            The context, or None when no matching context was found
+        """
+        for refresh in (False, True):
+            uri = discovery.find(device_names, description, refresh)
+            if not uri:
+                return None
+            try:
+                ctx = self._ctx_acquire(uri)
+            except Exception:
+                ctx = None
+            if ctx and all(ctx.find_device(n) for n in device_names or () if n):
+                return ctx
+            discovery.invalidate()
+        return None
+
+    def reconnect(self):
+        """Reconnect to the context after the connection was lost
+
+        Opens a new connection for the URI of this object, shared with
+        other objects when it came from the context pool, and looks up the
+        devices used by this object again. Buffers are recreated on next
+        use.
+        """
+        uri = getattr(self, "_ctx_uri", None)
+        if not uri:
+            raise Exception("Context was not created from a URI")
+        if self._ctx_pooled:
+            ctx = shared_contexts.reconnect(uri, self._ctx)
+        else:
+            ctx = iio.Context(uri)
+        for name, value in list(vars(self).items()):
+            if isinstance(value, iio.Device):
+                setattr(self, name, ctx.find_device(value.id))
+        self._ctx = ctx
+        for destroy in ("rx_destroy_buffer", "tx_destroy_buffer"):
+            if hasattr(self, destroy):
+                getattr(self, destroy)()
+        if hasattr(self, "refresh"):
+            self.refresh()
+
     def __init__(self, uri="", _device_name=""):
         if self._ctx:
             return
@@ -22,17 +391,13 @@ class context_manager(object):
             if self.uri == "":
                 # Try USB contexts first
                 if _device_name != "":
-                    contexts = iio.scan_contexts()
-                    for c in contexts:
-                        if _device_name in contexts[c]:
-                            self._ctx = iio.Context(c)
-                            break
+                    self._ctx = self._ctx_discover(description=_device_name)
                 # Try auto discover
                 if not self._ctx and self._uri_auto != "":
-                    self._ctx = iio.Context(self._uri_auto)
+                    self._ctx = self._ctx_acquire(self._uri_auto)
                 if not self._ctx:
                     raise Exception("No device found")
             else:
-                self._ctx = iio.Context(self.uri)
+                self._ctx = self._ctx_acquire(self.uri)
         except BaseException:
             raise Exception("No device found")
@@ -5,6 +5,9 @@
 import numpy as np
 from adi.attribute import attribute
 
+# Attributes set by the frequency, scale, phase and enabled columns of a tone
+_DDS_ATTRS = ("frequency", "scale", "phase", "raw")
+
 
 class dds(attribute):
     """ DDS Signal generators: Each reference design contains two DDSs per channel.
@@ -13,16 +16,50 @@ class dds(attribute):
 
     # Set to True if there are multiple DDS drivers (FMComms5)
     _split_cores = False
+    __dds_channel_list = None
+    __dds_state = None
+
+    def __dds_channels(self):
+        """DDS channels in index order, looked up once per DAC. Entries are
+        None where no channel was found"""
+        txdac = self._txdac
+        if self.__dds_channel_list is None or self.__dds_channel_list[0] is not txdac:
+            chans = []
+            split_cores_indx = 0
+            for indx in range(len(txdac.channels)):
+                chan = self._find_channel("altvoltage" + str(indx), True, txdac)
+                if not chan and self._split_cores:
+                    chan = self._find_channel(
+                        "altvoltage" + str(split_cores_indx),
+                        True,
+                        self._txdac_chip_b,
+                    )
+                    split_cores_indx = split_cores_indx + 1
+                chans.append(chan)
+            self.__dds_channel_list = (txdac, chans)
+            self.__dds_state = {}
+        return self.__dds_channel_list[1]
+
+    @staticmethod
+    def __dds_format(attr, value):
+        """Value as written to a DDS attribute, used to compare states"""
+        if attr == "scale":
+            return "{:.6f}".format(float(value))
+        return str(int(round(float(value))))
+
+    def __dds_channel_state(self, indx, chan):
+        """Last known attribute values of a DDS, read on first use"""
+        state = self.__dds_state.get(indx)
+        if state is None:
+            state = {
+                attr: self.__dds_format(attr, chan.attrs[attr].value)
+                for attr in _DDS_ATTRS
+            }
+            self.__dds_state[indx] = state
+        return state
 
     def __update_dds(self, attr, value):
-        split_cores_indx = 0
-        for indx in range(len(self._txdac.channels)):
-            chan = self._txdac.find_channel("altvoltage" + str(indx), True)
-            if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
-                    "altvoltage" + str(split_cores_indx), True
-                )
-                split_cores_indx = split_cores_indx + 1
+        for indx, chan in enumerate(self.__dds_channels()):
             if not chan:
                 return
             if indx >= len(value):
@@ -31,22 +68,58 @@ class dds(attribute):
                 chan.attrs[attr].value = str(int(value[indx]))
             else:
                 chan.attrs[attr].value = str(value[indx])
-            indx = indx + 1
+            self.__dds_state.pop(indx, None)
+
+    def dds_configure(self, tones, refresh=False):
+        """Configure DDSs from a table of tones, writing only the values
+        that differ from the last known DDS state
+
+        The state of each DDS is read once and then tracked as values are
+        written, so repeated calls only cost the writes that change
+        something.
+
+        parameters:
+            tones: type=numpy.array or list of lists
+                One row per DDS as (channel, frequency, scale, phase,
+                enabled). channel is the DDS index used by dds_frequencies
+                and the other properties. Frequency is in hertz, scale in
+                range [0,1] and phase in millidegrees. NaN leaves a value
+                unchanged
+            refresh: type=bool
+                Read the state of the DDSs again before comparing, for when
+                they may have been changed outside of this object
+
+        returns: type=int
+            Number of attribute writes issued
+        """
+        tones = np.atleast_2d(np.asarray(tones, dtype=float))
+        if tones.ndim != 2 or tones.shape[1] != len(_DDS_ATTRS) + 1:
+            raise Exception(
+                "tones must have 5 columns: channel, frequency, scale, phase, enabled"
+            )
+        chans = self.__dds_channels()
+        if refresh:
+            self.__dds_state = {}
+        writes = 0
+        for row in tones:
+            indx = int(row[0])
+            if indx < 0 or indx >= len(chans) or not chans[indx]:
+                raise Exception("DDS channel {} not found".format(indx))
+            chan = chans[indx]
+            state = self.__dds_channel_state(indx, chan)
+            for attr, value in zip(_DDS_ATTRS, row[1:]):
+                if np.isnan(value):
+                    continue
+                value = self.__dds_format(attr, value)
+                if state[attr] == value:
+                    continue
+                chan.attrs[attr].value = value
+                state[attr] = value
+                writes += 1
+        return writes
 
     def _read_dds(self, attr):
-        values = []
-        split_cores_indx = 0
-        for indx in range(len(self._txdac.channels)):
-            chan = self._txdac.find_channel("altvoltage" + str(indx), True)
-            if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
-                    "altvoltage" + str(split_cores_indx), True
-                )
-                split_cores_indx = split_cores_indx + 1
-            if not chan:
-                continue
-            values.append(chan.attrs[attr].value)
-            indx = indx + 1
+        values = [chan.attrs[attr].value for chan in self.__dds_channels() if chan]
         if values == []:
             return None
         return values
@@ -130,32 +203,34 @@ class dds(attribute):
             else:
                 A = "I"
                 B = "Q"
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + A + "_F1", True
+            chan = self._find_channel(
+                "TX" + str(channel + 1) + "_" + A + "_F1", True, self._txdac
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
                     + A
                     + "_F1",
                     True,
+                    self._txdac_chip_b,
                 )
             chan.attrs["frequency"].value = str(frequency)
             chan.attrs["phase"].value = str(90000)
             chan.attrs["scale"].value = str(scale)
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + B + "_F1", True
+            chan = self._find_channel(
+                "TX" + str(channel + 1) + "_" + B + "_F1", True, self._txdac
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
                     + B
                     + "_F1",
                     True,
+                    self._txdac_chip_b,
                 )
             chan.attrs["frequency"].value = str(frequency)
             chan.attrs["phase"].value = str(0)
@@ -163,7 +238,7 @@ class dds(attribute):
         else:
             if frequency < 0:
                 Exception("Frequency must be positive")
-            chan = self._txdac.find_channel(str(channel + 1) + "A", True)
+            chan = self._find_channel(str(channel + 1) + "A", True, self._txdac)
             chan.attrs["frequency"].value = str(frequency)
             chan.attrs["phase"].value = str(0)
             chan.attrs["scale"].value = str(scale)
@@ -212,32 +287,34 @@ class dds(attribute):
             else:
                 A = "I"
                 B = "Q"
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + A + "_F1", True
+            chan = self._find_channel(
+                "TX" + str(channel + 1) + "_" + A + "_F1", True, self._txdac
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
                     + A
                     + "_F1",
                     True,
+                    self._txdac_chip_b,
                 )
             chan.attrs["frequency"].value = str(frequency1)
             chan.attrs["phase"].value = str(90000)
             chan.attrs["scale"].value = str(scale1)
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + B + "_F1", True
+            chan = self._find_channel(
+                "TX" + str(channel + 1) + "_" + B + "_F1", True, self._txdac
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
                     + B
                     + "_F1",
                     True,
+                    self._txdac_chip_b,
                 )
             chan.attrs["frequency"].value = str(frequency1)
             chan.attrs["phase"].value = str(0)
@@ -250,32 +327,34 @@ class dds(attribute):
             else:
                 A = "I"
                 B = "Q"
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + A + "_F2", True
+            chan = self._find_channel(
+                "TX" + str(channel + 1) + "_" + A + "_F2", True, self._txdac
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
                     + A
                     + "_F2",
                     True,
+                    self._txdac_chip_b,
                 )
             chan.attrs["frequency"].value = str(frequency2)
             chan.attrs["phase"].value = str(90000)
             chan.attrs["scale"].value = str(scale2)
-            chan = self._txdac.find_channel(
-                "TX" + str(channel + 1) + "_" + B + "_F2", True
+            chan = self._find_channel(
+                "TX" + str(channel + 1) + "_" + B + "_F2", True, self._txdac
             )
             if not chan and self._split_cores:
-                chan = self._txdac_chip_b.find_channel(
+                chan = self._find_channel(
                     "TX"
                     + str(channel - int(self._num_tx_channels / 4) + 1)
                     + "_"
                     + B
                     + "_F2",
                     True,
+                    self._txdac_chip_b,
                 )
             chan.attrs["frequency"].value = str(frequency2)
             chan.attrs["phase"].value = str(0)
@@ -285,11 +364,11 @@ class dds(attribute):
                 Exception("Frequency must be positive")
             if frequency2 < 0:
                 Exception("Frequency must be positive")
-            chan = self._txdac.find_channel(str(channel + 1) + "A", True)
+            chan = self._find_channel(str(channel + 1) + "A", True, self._txdac)
             chan.attrs["frequency"].value = str(frequency1)
             chan.attrs["phase"].value = str(0)
             chan.attrs["scale"].value = str(scale1)
-            chan = self._txdac.find_channel(str(channel + 1) + "B", True)
+            chan = self._find_channel(str(channel + 1) + "B", True, self._txdac)
             chan.attrs["frequency"].value = str(frequency2)
             chan.attrs["phase"].value = str(0)
             chan.attrs["scale"].value = str(scale2)
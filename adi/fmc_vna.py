@@ -32,4 +32,4 @@ class fmcvna(adrf5720, ad9083, admv8818, genmux, adf5610, adl5960):
         ad9083.__init__(self, uri)
         one_bit_adc_dac.__init__(self, uri)
 
-        self._rxadc.set_kernel_buffers_count(1)
+        self.rx_kernel_buffers_count = 1
@@ -2,16 +2,24 @@
 #
 # SPDX short identifier: ADIBSD
 
+import itertools
+
 import numpy as np
 from adi.ad5627 import ad5627
 from adi.ad9094 import ad9094
 from adi.rx_tx import phy
 
+# Group of four physical channels of a refill in auto sequencer mode, looked
+# up from the Channel4 pattern as an unsigned byte. -1 for unknown patterns
+_PATTERN_GROUP = np.full(256, -1, dtype=np.int8)
+_PATTERN_GROUP[[0x00, 0x55, 0xAA, 0xFF]] = [0, 1, 2, 3]
+
 
 class fmclidar1(ad5627, ad9094, phy):
     """ LiDAR """
 
     _device_name = "LiDAR"
+    __wasted_refills = 0
 
     def __init__(self, uri, pulse_capture_address="7c700000"):
         ad5627.__init__(self, uri)
@@ -22,6 +30,100 @@ class fmclidar1(ad5627, ad9094, phy):
         self._ctrl = self._ctx.find_device(self.pulse_capture)
         self.set_all_iio_attrs_to_default_values()
 
+    def __auto_layout(self):
+        """Layout of the refills read in auto sequencer mode"""
+        shape, dtype = self._rx_output_layout()
+        if shape[0] != 5:
+            raise Exception(
+                "Auto sequencer mode needs rx_enabled_channels [0, 1, 2, 3, 4]"
+            )
+        return shape, dtype
+
+    def __assemble(self, blocks, frames):
+        """Assemble refills into frames of all 16 channels
+
+        Each refill is classified by its Channel4 pattern and copied into
+        the rows of its channel group. Refills of a group already captured
+        for the current frame, or with an unknown pattern, are discarded.
+
+        parameters:
+            blocks: type=iterator
+                (5, samples) refills, Channel4 in the last row
+            frames: type=iterator
+                (16, samples) int8 arrays to assemble frames into
+        """
+        frame = None
+        seen = np.zeros(4, dtype=bool)
+        for block in blocks:
+            group = _PATTERN_GROUP[int(block[4, 0]) & 0xFF]
+            if group < 0 or seen[group]:
+                self.__wasted_refills += 1
+                continue
+            if frame is None:
+                frame = next(frames)
+            np.copyto(frame[4 * group : 4 * group + 4], block[:4], casting="unsafe")
+            seen[group] = True
+            if seen.all():
+                yield frame
+                frame = None
+                seen[:] = False
+
+    @property
+    def rx_wasted_refills(self):
+        """rx_wasted_refills: Number of refills discarded by the last capture
+        or frame stream in auto sequencer mode, because the channel group of
+        their Channel4 pattern was already captured for the frame or the
+        pattern was unknown"""
+        return self.__wasted_refills
+
+    def capture(self, frames=1):
+        """Capture frames of all 16 channels in auto sequencer mode. Buffers
+        are refilled until each frame has seen all four Channel4 patterns.
+
+        parameters:
+            frames: type=int
+                Number of frames to capture
+
+        returns: type=numpy.array
+            int8 array of shape (frames, 16, rx_buffer_size)
+        """
+        shape, dtype = self.__auto_layout()
+        out = np.empty((frames, 16, shape[1]), dtype=np.int8)
+        block = np.empty(shape, dtype=dtype)
+        refills = (self.rx_into(block) for _ in itertools.count())
+        self.__wasted_refills = 0
+        assembled = self.__assemble(refills, iter(out))
+        for _ in range(frames):
+            next(assembled)
+        return out
+
+    def rx_frames(self, frames=None, queue_size=2):
+        """Stream frames of all 16 channels in auto sequencer mode. Buffers
+        are refilled on a background thread, see rx_stream.
+
+        parameters:
+            frames: type=int
+                Number of frames to yield before stopping. None streams
+                until the generator is closed
+            queue_size: type=int
+                Number of refills that can wait to be assembled. Refills
+                received while the queue is full are dropped
+
+        returns: type=generator
+            Yields int8 arrays of shape (16, rx_buffer_size). Each array is
+            reused once the frame after the next one is requested
+        """
+        shape, _ = self.__auto_layout()
+        ring = [np.empty((16, shape[1]), dtype=np.int8) for _ in range(2)]
+        self.__wasted_refills = 0
+        blocks = iter(self.rx_stream(queue_size))
+        try:
+            assembled = self.__assemble(blocks, itertools.cycle(ring))
+            for frame in itertools.islice(assembled, frames):
+                yield frame
+        finally:
+            blocks.close()
+
     def rx(self):
         """Read the buffers for all the enabled channels, except Channel4 which should
         be all zeroes and not relevant for the user.
@@ -34,52 +136,10 @@ class fmclidar1(ad5627, ad9094, phy):
             for i, pos in enumerate(self.channel_sequencer_order_manual_mode):
                 all_channels[int(i * 4 + pos)] = rx[i]
         else:
-            # Wait until we've seen all the patterns (4 in total), meaning all
-            # the 16 channels have been updated, before returning.
-            first = False
-            second = False
-            third = False
-            fourth = False
-
             # Channel4 holds the channel pattern. This is used to figure out the
-            # actual physical channel that the reading comes from. Keep
-            # refilling the buffers until all 16 channels have been read.
-            while (
-                (first is False)
-                or (second is False)
-                or (third is False)
-                or (fourth is False)
-            ):
-                rx = super().rx()
-                pattern = rx[4][0]  # One entry from one Channel4 sample
-                # print(str(pattern) + " ", end='')
-                if pattern == 0 and first is False:
-                    all_channels[0] = rx[0].astype(np.int8)
-                    all_channels[1] = rx[1].astype(np.int8)
-                    all_channels[2] = rx[2].astype(np.int8)
-                    all_channels[3] = rx[3].astype(np.int8)
-                    first = True
-
-                if pattern == 85 and second is False:
-                    all_channels[4] = rx[0].astype(np.int8)
-                    all_channels[5] = rx[1].astype(np.int8)
-                    all_channels[6] = rx[2].astype(np.int8)
-                    all_channels[7] = rx[3].astype(np.int8)
-                    second = True
-
-                if pattern == -86 and third is False:
-                    all_channels[8] = rx[0].astype(np.int8)
-                    all_channels[9] = rx[1].astype(np.int8)
-                    all_channels[10] = rx[2].astype(np.int8)
-                    all_channels[11] = rx[3].astype(np.int8)
-                    third = True
-
-                if pattern == -1 and fourth is False:
-                    all_channels[12] = rx[0].astype(np.int8)
-                    all_channels[13] = rx[1].astype(np.int8)
-                    all_channels[14] = rx[2].astype(np.int8)
-                    all_channels[15] = rx[3].astype(np.int8)
-                    fourth = True
+            # actual physical channel that the reading comes from. Buffers are
+            # refilled until all 16 channels have been read.
+            all_channels = list(self.capture(1)[0])
 
         return all_channels
 
@@ -24,17 +24,21 @@ class jesd:
 
     def find_lanes(self):
         self.lanes = {}
-        for dr in self.dirs:
-            if "-rx" in dr:
-                self.lanes[dr] = []
-                lanIndx = 0
-                while 1:
-                    li = "/lane{}_info".format(lanIndx)
-                    if self.fs.isfile(self.rootdir + dr + li):
-                        self.lanes[dr].append(li)
-                        lanIndx += 1
-                    else:
-                        break
+        rx_dirs = [dr for dr in self.dirs if "-rx" in dr]
+        # List lane info files of all links in one round trip
+        found = self.fs.gettexts(
+            [self.rootdir + dr + "/lane*_info" for dr in rx_dirs], glob=True
+        )
+        for dr in rx_dirs:
+            self.lanes[dr] = []
+            lanIndx = 0
+            while 1:
+                li = "/lane{}_info".format(lanIndx)
+                if self.rootdir + dr + li in found:
+                    self.lanes[dr].append(li)
+                    lanIndx += 1
+                else:
+                    break
 
     def find_jesd_dir(self):
         dirs = self.fs.listdir(self.rootdir)
@@ -68,11 +72,28 @@ class jesd:
         }
 
     def get_all_link_statuses(self):
+        # Read every lane of every link in one round trip
+        paths = {
+            (dr, ldir): self.rootdir + dr + ldir
+            for dr in self.dirs
+            if "-rx" in dr
+            for ldir in self.lanes[dr]
+        }
+        texts = self.fs.gettexts(list(paths.values()))
         statuses = dict()
         for dr in self.dirs:
             if "-rx" in dr:
-                statuses[dr] = self.get_dev_lane_info(dr)
+                statuses[dr] = {
+                    ldir.replace("/", ""): self.decode_status(
+                        texts.get(paths[(dr, ldir)], "")
+                    )
+                    for ldir in self.lanes[dr]
+                }
         return statuses
 
     def get_all_statuses(self):
-        return {dr: self.decode_status(self.get_status(dr)) for dr in self.dirs}
+        texts = self.fs.gettexts([self.rootdir + dr + "/status" for dr in self.dirs])
+        return {
+            dr: self.decode_status(texts.get(self.rootdir + dr + "/status", ""))
+            for dr in self.dirs
+        }
@@ -0,0 +1,217 @@
+# Copyright (C) 2024 Analog Devices, Inc.
+#
+# SPDX short identifier: ADIBSD
+
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+jesd_event = namedtuple(
+    "jesd_event", ["time", "source", "link", "lane", "field", "old", "new"]
+)
+jesd_event.__doc__ = """Change of a JESD link, lane or FSM field between two samples"""
+
+_FSM_FIELDS = {
+    "state": "jesd204_fsm_state",
+    "paused": "jesd204_fsm_paused",
+    "error": "jesd204_fsm_error",
+}
+
+
+class jesd_monitor(object):
+    """JESD link health monitor
+
+    Link and lane status are sampled on a background thread and compared
+    against the previous sample. Only changes are reported, through
+    callbacks and the events queue, and the last changes are kept in a
+    history ring. Per lane error counts and the time spent in each link
+    state are accumulated.
+
+    parameters:
+        sources: type=dict
+            Names mapped to objects to monitor. adi.jesd objects are sampled
+            with get_all_statuses (and get_all_link_statuses when lanes is
+            True). Device objects with jesd204_fsm_* properties, like
+            adi.ad9081, have their FSM sampled, and their JESD status as
+            well when they were created with JESD monitoring
+        interval: type=float
+            Seconds between samples
+        history: type=int
+            Number of change events kept in history
+        lanes: type=bool
+            Sample lane information of RX links
+        queue_size: type=int
+            Number of change events that can wait in the events queue.
+            Events are dropped and counted when it is full
+    """
+
+    def __init__(
+        self, sources, interval=1.0, history=1000, lanes=True, queue_size=1000
+    ):
+        if not isinstance(sources, dict):
+            raise Exception("sources must be a dict of names to objects")
+        self._sources = sources
+        self.interval = interval
+        self.lanes = lanes
+        self.history = deque(maxlen=history)
+        self.events = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.samples = 0
+        self.sample_errors = 0
+        self.last_error = None
+        self.error_counts = {}
+        self.time_in_state = {}
+        self._callbacks = []
+        self._snapshot = None
+        self._states = {}
+        self._last_time = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """running: True while the sampling thread is active"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def snapshot(self) -> dict:
+        """snapshot: Last sampled values keyed by (source, link, lane, field).
+        lane is None for link fields"""
+        with self._lock:
+            return dict(self._snapshot or {})
+
+    def add_callback(self, callback):
+        """Call a function with each change event
+
+        parameters:
+            callback: type=callable
+                Called with a jesd_event from the sampling thread
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """Stop calling a function registered with add_callback
+
+        parameters:
+            callback: type=callable
+                Function to remove
+        """
+        self._callbacks.remove(callback)
+
+    def _read_source(self, name, obj):
+        values = {}
+        jesd = obj if hasattr(obj, "get_all_statuses") else getattr(obj, "_jesd", None)
+        if jesd is not None:
+            for link, status in jesd.get_all_statuses().items():
+                for field, value in status.items():
+                    values[(name, link, None, field)] = value
+            if self.lanes:
+                for link, lanes in jesd.get_all_link_statuses().items():
+                    for lane, status in lanes.items():
+                        for field, value in status.items():
+                            values[(name, link, lane, field)] = value
+        if jesd is not obj and hasattr(obj, "jesd204_fsm_state"):
+            for field, prop in _FSM_FIELDS.items():
+                values[(name, "jesd204_fsm", None, field)] = getattr(obj, prop)
+        return values
+
+    def __accumulate(self, snapshot, now):
+        """Update error counters and time in state from a new sample"""
+        dt = 0.0 if self._last_time is None else now - self._last_time
+        self._last_time = now
+        for (name, link, lane, field), value in snapshot.items():
+            if lane is not None and field == "Errors":
+                key = (name, link, lane)
+                try:
+                    errors = int(value)
+                except ValueError:
+                    continue
+                old = (
+                    self._snapshot.get((name, link, lane, field))
+                    if self._snapshot
+                    else None
+                )
+                try:
+                    old = int(old)
+                except (TypeError, ValueError):
+                    old = None
+                total = self.error_counts.get(key, 0)
+                if old is not None:
+                    # A lower count means the counter was reset
+                    total += errors - old if errors >= old else errors
+                self.error_counts[key] = total
+            elif lane is None and field in ("Link status", "state"):
+                key = (name, link)
+                state = self._states.get(key)
+                if state is not None:
+                    times = self.time_in_state.setdefault(key, {})
+                    times[state] = times.get(state, 0.0) + dt
+                self._states[key] = value
+
+    def sample(self):
+        """Sample all sources once and report changes
+
+        returns: type=list[jesd_event]
+            Changes since the previous sample. The first sample only
+            records the baseline and returns no events
+        """
+        snapshot = {}
+        for name, obj in self._sources.items():
+            snapshot.update(self._read_source(name, obj))
+        now = time.time()
+        events = []
+        with self._lock:
+            self.__accumulate(snapshot, time.monotonic())
+            if self._snapshot is not None:
+                for key in sorted(
+                    set(snapshot) | set(self._snapshot), key=lambda k: str(k)
+                ):
+                    old = self._snapshot.get(key)
+                    new = snapshot.get(key)
+                    if old != new:
+                        events.append(jesd_event(now, *key, old, new))
+            self._snapshot = snapshot
+            self.samples += 1
+        for event in events:
+            self.history.append(event)
+            try:
+                self.events.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+            for callback in list(self._callbacks):
+                callback(event)
+        return events
+
+    def start(self):
+        """Start sampling on a background thread"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.__sample_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the sampling thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __sample_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                self.sample()
+            except Exception as ex:
+                # Keep monitoring through transient connection problems
+                self.sample_errors += 1
+                self.last_error = ex
+            self._stop_event.wait(self.interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,74 @@
+# Copyright (C) 2024 Analog Devices, Inc.
+#
+# SPDX short identifier: ADIBSD
+
+
+class multi_som(object):
+    """Capture helpers shared by the multi-SOM managers
+
+    Classes using it hold their devices in primary and secondaries.
+    """
+
+    _parallel = True
+    _rx_reuse_buffers = False
+
+    @property
+    def rx_reuse_buffers(self):
+        """rx_reuse_buffers: Keep RX buffers between captures and only re-arm
+        sync start. Stale blocks are flushed after arming, which needs at
+        least 2 kernel buffers per device, so enabling it raises
+        rx_kernel_buffers_count to 2 where lower. Buffers are still
+        recreated when the buffer size or enabled channels change"""
+        return self._rx_reuse_buffers
+
+    @rx_reuse_buffers.setter
+    def rx_reuse_buffers(self, value):
+        self._rx_reuse_buffers = bool(value)
+        if not value:
+            return
+        for dev in [self.primary] + self.secondaries:
+            if dev.rx_kernel_buffers_count < 2:
+                dev.rx_kernel_buffers_count = 2
+
+    def _for_all_devs(self, func, devs=None):
+        """Run func(dev) on every device and wait for all of them
+
+        Devices are handled in parallel on the worker thread of their
+        context, so each call acts as a barrier between bring-up and
+        capture steps. Results are returned in device order.
+        """
+        if devs is None:
+            devs = [self.primary] + self.secondaries
+        if not self._parallel:
+            return [func(dev) for dev in devs]
+        futures = [dev._context_worker().submit(func, dev) for dev in devs]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _rx_recreate_buffer(dev):
+        dev.rx_destroy_buffer()
+        dev._rx_init_channels()
+
+    @staticmethod
+    def _rx_flush_buffer(dev):
+        # Blocks filled before arming hold stale data. Refilling them queues
+        # the released blocks behind the armed sync, so the next refill
+        # returns data starting at SYSREF. The flush does not wait, since no
+        # block completes before SYSREF. When fewer blocks were ready, one
+        # was partly filled when sync was armed, so the buffer is recreated
+        count = dev.rx_kernel_buffers_count - 1
+        if dev._rx_flush(count, blocking=False) < count:
+            multi_som._rx_recreate_buffer(dev)
+
+    def _rx_buffers_reusable(self):
+        return self._rx_reuse_buffers and all(
+            dev._rx_buffer_reusable() and dev.rx_kernel_buffers_count > 1
+            for dev in [self.primary] + self.secondaries
+        )
+
+    def _rx_prepare_buffers(self):
+        """Flush reusable buffers, or recreate them, after sync is armed"""
+        if self._rx_buffers_reusable():
+            self._for_all_devs(self._rx_flush_buffer)
+        else:
+            self._for_all_devs(self._rx_recreate_buffer)
@@ -0,0 +1,129 @@
+# Copyright (C) 2024 Analog Devices, Inc.
+#
+# SPDX short identifier: ADIBSD
+
+import hashlib
+import os
+import threading
+import weakref
+
+
+class profile_cache(object):
+    """Process wide cache of profile and stream files
+
+    Files are read once and kept with a hash of their contents. They are
+    read again only when their size or modification time changes. The hash
+    of what was last loaded into each device attribute is remembered, so
+    loading the same contents again can be skipped. Devices are identified
+    by the serial number or URI of their context, so the hash is kept for
+    new objects and new connections to the same hardware. Contexts without
+    either are tracked for as long as the context exists.
+    """
+
+    def __init__(self):
+        self.__files = {}
+        self.__loaded = {}
+        self.__loaded_ctx = weakref.WeakKeyDictionary()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def _context_id(ctx):
+        """Stable identity of the hardware behind a context, or None"""
+        attrs = getattr(ctx, "attrs", None) or {}
+        for name in ("hw_serial", "usb,serial", "uri"):
+            if attrs.get(name):
+                return (name, attrs[name])
+        return None
+
+    def __entries(self, ctx):
+        """Loaded hashes of a context, keyed by (device ID, attribute)"""
+        ident = self._context_id(ctx)
+        if ident is None:
+            return self.__loaded_ctx.setdefault(ctx, {})
+        return self.__loaded.setdefault(ident, {})
+
+    def read(self, path, binary=False):
+        """Contents of a file and their hash
+
+        parameters:
+            path: type=string
+                Path of the file
+            binary: type=bool
+                Read bytes instead of text
+
+        returns: type=tuple
+            Hash as a hex string and the contents
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), binary)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        with self.__lock:
+            entry = self.__files.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1], entry[2]
+        with open(path, "rb" if binary else "r") as file:
+            data = file.read()
+        digest = hashlib.sha256(data if binary else data.encode()).hexdigest()
+        with self.__lock:
+            self.__files[key] = (stamp, digest, data)
+        return digest, data
+
+    def preload(self, paths, binary=False):
+        """Read files into the cache ahead of loading them
+
+        parameters:
+            paths: type=list[string]
+                Paths of the files
+            binary: type=bool
+                Read bytes instead of text, as for stream files
+
+        returns: type=dict
+            Paths mapped to the hash of their contents
+        """
+        return {path: self.read(path, binary)[0] for path in paths}
+
+    def is_loaded(self, ctx, dev, attr, digest) -> bool:
+        """Check if contents with a hash were the last loaded into an attribute
+
+        parameters:
+            ctx: type=iio.Context
+                Context of the device
+            dev: type=iio.Device
+                Device of the attribute
+            attr: type=string
+                Name of the device attribute
+            digest: type=string
+                Hash returned by read
+        """
+        with self.__lock:
+            return self.__entries(ctx).get((dev.id, attr)) == digest
+
+    def set_loaded(self, ctx, dev, attr, digest):
+        """Record the hash of what was loaded into an attribute
+
+        parameters:
+            ctx: type=iio.Context
+                Context of the device
+            dev: type=iio.Device
+                Device of the attribute
+            attr: type=string
+                Name of the device attribute
+            digest: type=string
+                Hash returned by read, or None when the contents are unknown
+        """
+        with self.__lock:
+            loaded = self.__entries(ctx)
+            if digest is None:
+                loaded.pop((dev.id, attr), None)
+            else:
+                loaded[(dev.id, attr)] = digest
+
+    def clear(self):
+        """Forget cached files and what is loaded on all devices"""
+        with self.__lock:
+            self.__files.clear()
+            self.__loaded.clear()
+            self.__loaded_ctx.clear()
+
+
+profiles = profile_cache()
@@ -2,6 +2,7 @@
 #
 # SPDX short identifier: ADIBSD
 
+import errno
 from abc import ABCMeta, abstractmethod
 from typing import List, Union
 
@@ -9,8 +10,9 @@ import iio
 
 import numpy as np
 from adi.attribute import attribute
-from adi.context_manager import context_manager
+from adi.context_manager import context_manager, discovery
 from adi.dds import dds
+from adi.stream import rx_streamer, tx_streamer
 
 
 class phy(attribute):
@@ -40,9 +42,18 @@ class rx(rx_tx_common):
     __rx_enabled_channels = [0]
     _rx_output_type = "raw"
     __rxbuf = None
+    __rxbuf_config = None
     _rx_unbuffered_data = False
     _rx_annotated = False
     _rx_stack_interleaved = True  # Convert from channel to sample interleaved
+    _rx_zero_copy = False
+    _rx_stacked = False
+    _rx_output_ring_size = 0
+    _rx_output_dtype = np.dtype(np.complex128)
+    _rx_kernel_buffers_count = 4
+    __rx_sample_dtype = None
+    __rx_output_ring = None
+    __rx_output_ring_index = 0
 
     def __init__(self, rx_buffer_size=1024):
         if self._complex_data:
@@ -81,6 +92,99 @@ class rx(rx_tx_common):
             raise ValueError(f"Invalid rx_output_type: {value}. Must be raw or SI")
         self._rx_output_type = value
 
+    @property
+    def rx_output_dtype(self) -> np.dtype:
+        """rx_output_dtype: Data type of complex data produced by rx()
+
+        Only applies to complex data devices. Options are complex128
+        (default), complex64, or an integer type. With an integer type each
+        complex channel is returned as a (samples, 2) array of I/Q pairs,
+        which is a view into the buffer when the type matches the hardware
+        format.
+        """
+        return self._rx_output_dtype
+
+    @rx_output_dtype.setter
+    def rx_output_dtype(self, value):
+        """rx_output_dtype: Data type of complex data produced by rx()"""
+        value = np.dtype(value)
+        if value not in (np.complex64, np.complex128) and value.kind != "i":
+            raise ValueError(
+                f"Invalid rx_output_dtype: {value}. Must be complex64, "
+                + "complex128 or an integer type"
+            )
+        if not self._complex_data:
+            raise ValueError("rx_output_dtype only applies to complex data devices")
+        self._rx_output_dtype = value
+        self.__rx_output_ring = None
+
+    @property
+    def rx_zero_copy(self) -> bool:
+        """rx_zero_copy: Read the RX buffer once and return strided views
+
+        When True, rx() copies the whole hardware buffer once and returns
+        NumPy views over the sample interleaved block instead of reading
+        each enabled channel into its own array.
+        """
+        return self._rx_zero_copy
+
+    @rx_zero_copy.setter
+    def rx_zero_copy(self, value: bool):
+        """rx_zero_copy: Read the RX buffer once and return strided views"""
+        self._rx_zero_copy = bool(value)
+
+    @property
+    def rx_stacked(self) -> bool:
+        """rx_stacked: Return a single 2D (channels, samples) array from rx()
+
+        Only applies when rx_zero_copy is True. For complex data devices
+        rows are complex channels, not individual I or Q channels.
+        """
+        return self._rx_stacked
+
+    @rx_stacked.setter
+    def rx_stacked(self, value: bool):
+        """rx_stacked: Return a single 2D (channels, samples) array from rx()"""
+        self._rx_stacked = bool(value)
+
+    @property
+    def rx_output_ring_size(self) -> int:
+        """rx_output_ring_size: Number of preallocated output arrays for rx()
+
+        When non-zero, rx() fills and returns arrays from a ring of this many
+        preallocated outputs sized from rx_buffer_size and
+        rx_enabled_channels instead of allocating new arrays on every call.
+        Data returned by rx() is overwritten after this many further calls.
+        Set to 0 to disable (default).
+        """
+        return self._rx_output_ring_size
+
+    @rx_output_ring_size.setter
+    def rx_output_ring_size(self, value: int):
+        """rx_output_ring_size: Number of preallocated output arrays for rx()"""
+        if not isinstance(value, int) or value < 0:
+            raise ValueError("rx_output_ring_size must be a non-negative integer")
+        self._rx_output_ring_size = value
+        self.__rx_output_ring = None
+
+    @property
+    def rx_kernel_buffers_count(self) -> int:
+        """rx_kernel_buffers_count: Number of kernel buffers used for RX DMA
+
+        More kernel buffers let the hardware keep capturing while earlier
+        buffers are being read. Setting it destroys an existing RX buffer,
+        which is created again with the new count on the next receive.
+        """
+        return self._rx_kernel_buffers_count
+
+    @rx_kernel_buffers_count.setter
+    def rx_kernel_buffers_count(self, value: int):
+        """rx_kernel_buffers_count: Number of kernel buffers used for RX DMA"""
+        if self.__rxbuf:
+            self.rx_destroy_buffer()
+        self._rxadc.set_kernel_buffers_count(value)
+        self._rx_kernel_buffers_count = value
+
     @property
     def rx_buffer_size(self):
         """rx_buffer_size: Size of receive buffer in samples"""
@@ -146,6 +250,7 @@ class rx(rx_tx_common):
     def rx_destroy_buffer(self):
         """rx_destroy_buffer: Clears RX buffer"""
         self.__rxbuf = None
+        self.__rx_sample_dtype = None
 
     def __del__(self):
         self.__rxbuf = []
@@ -158,7 +263,7 @@ class rx(rx_tx_common):
     def __get_rx_channel_scales(self):
         rx_scale = []
         for i in self.rx_enabled_channels:
-            v = self._rxadc.find_channel(self._rx_channel_names[i])
+            v = self._find_channel(self._rx_channel_names[i], False, self._rxadc)
             if "scale" in v.attrs:
                 scale = self._get_iio_attr(self._rx_channel_names[i], "scale", False)
             else:
@@ -169,7 +274,7 @@ class rx(rx_tx_common):
     def __get_rx_channel_offsets(self):
         rx_offset = []
         for i in self.rx_enabled_channels:
-            v = self._rxadc.find_channel(self._rx_channel_names[i])
+            v = self._find_channel(self._rx_channel_names[i], False, self._rxadc)
             if "offset" in v.attrs:
                 offset = self._get_iio_attr(self._rx_channel_names[i], "offset", False)
             else:
@@ -177,24 +282,117 @@ class rx(rx_tx_common):
             rx_offset.append(offset)
         return rx_offset
 
+    def _rx_enabled_channel_names(self) -> List[str]:
+        """Names of the enabled component channels in rx() output order"""
+        if self._complex_data:
+            ecn = []
+            for m in self.rx_enabled_channels:
+                ecn.extend(
+                    (self._rx_channel_names[m * 2], self._rx_channel_names[m * 2 + 1])
+                )
+            return ecn
+        return [self._rx_channel_names[m] for m in self.rx_enabled_channels]
+
+    def __rx_build_sample_dtype(self):
+        """Build a structured dtype describing one sample of the RX buffer
+
+        Enabled scan elements are laid out in scan index order, each aligned
+        to its own storage size, matching the sample layout used by libiio.
+        """
+        chans = [
+            chan
+            for chan in self._rxadc.channels
+            if chan.enabled and chan.scan_element and chan.index >= 0
+        ]
+        chans.sort(key=lambda chan: chan.index)
+        names, formats, offsets, fmts = [], [], [], {}
+        size = 0
+        last_index = None
+        for chan in chans:
+            df = chan.data_format
+            length = df.length // 8
+            fmt = (">" if df.is_be else "<") + ("i" if df.is_signed else "u")
+            fmt += str(length)
+            if chan.index == last_index:
+                # Channels sharing a scan index share storage
+                offset = offsets[-1]
+            else:
+                offset = -(-size // length) * length
+                size = offset + length * df.repeat
+            last_index = chan.index
+            names.append(chan.id)
+            formats.append((fmt, (df.repeat,)) if df.repeat > 1 else fmt)
+            offsets.append(offset)
+            fmts[chan.id] = df
+        dtype = np.dtype(
+            {"names": names, "formats": formats, "offsets": offsets, "itemsize": size}
+        )
+        return dtype, fmts
+
+    def __rx_sample_format(self):
+        """Structured sample dtype and per channel data formats of the buffer"""
+        if self.__rx_sample_dtype is None:
+            self.__rx_sample_dtype = self.__rx_build_sample_dtype()
+        return self.__rx_sample_dtype
+
     def _rx_init_channels(self):
         for m in self._rx_channel_names:
-            v = self._rxadc.find_channel(m)
+            v = self._find_channel(m, False, self._rxadc)
             if not v:
                 raise Exception(f"Channel {m} not found")
             v.enabled = False
 
         if self._complex_data:
             for m in self.rx_enabled_channels:
-                v = self._rxadc.find_channel(self._rx_channel_names[m * 2])
+                v = self._find_channel(
+                    self._rx_channel_names[m * 2], False, self._rxadc
+                )
                 v.enabled = True
-                v = self._rxadc.find_channel(self._rx_channel_names[m * 2 + 1])
+                v = self._find_channel(
+                    self._rx_channel_names[m * 2 + 1], False, self._rxadc
+                )
                 v.enabled = True
         else:
             for m in self.rx_enabled_channels:
-                v = self._rxadc.find_channel(self._rx_channel_names[m])
+                v = self._find_channel(self._rx_channel_names[m], False, self._rxadc)
                 v.enabled = True
         self.__rxbuf = iio.Buffer(self._rxadc, self.__rx_buffer_size, False)
+        self.__rxbuf_config = self.__rx_buffer_config()
+        self.__rx_sample_dtype = None
+
+    def __rx_buffer_config(self):
+        return (self.__rx_buffer_size, tuple(self.rx_enabled_channels))
+
+    def _rx_buffer_reusable(self) -> bool:
+        """True if the RX buffer exists and was created for the current
+        buffer size and enabled channels"""
+        return bool(self.__rxbuf) and self.__rxbuf_config == self.__rx_buffer_config()
+
+    def _rx_flush(self, blocks, blocking=True):
+        """Refill the RX buffer and discard the data, blocks times
+
+        When blocking is False, only blocks already filled by the hardware
+        are discarded. Returns the number of blocks discarded, which is 0
+        when the backend does not support non-blocking refills.
+        """
+        if blocking:
+            for _ in range(blocks):
+                self.__rxbuf.refill()
+            return blocks
+        if self.__rxbuf.set_blocking_mode(False):
+            # Non-zero error code, the backend does not support it
+            return 0
+        flushed = 0
+        try:
+            while flushed < blocks:
+                self.__rxbuf.refill()
+                flushed += 1
+        except OSError as ex:
+            if ex.errno != errno.EAGAIN:
+                raise
+        finally:
+            self.__rxbuf.set_blocking_mode(True)
+        return flushed
 
     def __rx_unbuffered_data(self):
         x = []
@@ -223,29 +421,68 @@ class rx(rx_tx_common):
 
         return x
 
-    def __rx_buffered_data(self) -> Union[List[np.ndarray], np.ndarray]:
+    def __rx_refill_raw(self) -> bytearray:
+        """Refill the RX buffer and return a single copy of its contents"""
+        if not self.__rxbuf:
+            self._rx_init_channels()
+        self.__rxbuf.refill()
+        return self.__rxbuf.read()
+
+    def __rx_iq_pairs(self, raw) -> Union[List[np.ndarray], None]:
+        """__rx_iq_pairs: I/Q pair views of each enabled complex channel
+
+        Returns:
+            List of (samples, 2) arrays viewing the I and Q samples of each
+            enabled complex channel in raw, or None when the buffer layout
+            does not store them adjacently in a common format
+        """
+        dtype, fmts = self.__rx_sample_format()
+        fields = [dtype.fields[name] for name in dtype.names]
+        base = fields[0][0]
+        if base.shape or dtype.itemsize != len(fields) * base.itemsize:
+            return None
+        for name, (fmt, offset) in zip(dtype.names, fields):
+            df = fmts[name]
+            bits = df.bits if df.bits else df.length
+            if fmt != base or offset % base.itemsize or df.shift or bits != df.length:
+                return None
+        block = np.frombuffer(raw, dtype=base).reshape(-1, len(fields))
+        ecn = self._rx_enabled_channel_names()
+        pairs = []
+        for i_name, q_name in zip(ecn[0::2], ecn[1::2]):
+            col = dtype.fields[i_name][1] // base.itemsize
+            if dtype.fields[q_name][1] // base.itemsize != col + 1:
+                return None
+            pairs.append(block[:, col : col + 2])
+        return pairs
+
+    def __rx_buffered_data(
+        self, views=None, stacked=None
+    ) -> Union[List[np.ndarray], np.ndarray]:
         """__rx_buffered_data: Read data from RX buffer
 
+        parameters:
+            views: type=bool
+                Read the buffer once and return views. Defaults to rx_zero_copy
+            stacked: type=bool
+                Return a 2D array when views are used. Defaults to rx_stacked
+
         Returns:
             List of numpy arrays containing the data from the RX buffer that are
             channel interleaved
         """
+        ecn = self._rx_enabled_channel_names()
+        if self._rx_zero_copy if views is None else views:
+            stacked = self._rx_stacked if stacked is None else stacked
+            return self.__rx_buffer_views(self.__rx_refill_raw(), ecn, stacked)
+
         if not self.__rxbuf:
             self._rx_init_channels()
         self.__rxbuf.refill()
 
         data_channel_interleaved = []
-        ecn = []
-        if self._complex_data:
-            for m in self.rx_enabled_channels:
-                ecn.extend(
-                    (self._rx_channel_names[m * 2], self._rx_channel_names[m * 2 + 1])
-                )
-        else:
-            ecn = [self._rx_channel_names[m] for m in self.rx_enabled_channels]
-
         for name in ecn:
-            chan = self._rxadc.find_channel(name)
+            chan = self._find_channel(name, False, self._rxadc)
             bytearray_data = chan.read(self.__rxbuf)  # Do local type conversion
             # create format strings
             df = chan.data_format
@@ -254,7 +491,80 @@ class rx(rx_tx_common):
 
         return data_channel_interleaved
 
+    def __rx_buffer_views(self, raw, ecn, stacked):
+        """__rx_buffer_views: Deinterleave a whole RX buffer without copies
+
+        parameters:
+            raw: type=bytearray
+                Contents of the refilled RX buffer
+            ecn: type=list[str]
+                Names of the component channels to return, in output order
+            stacked: type=bool
+                Return a single 2D (channels, samples) array
+
+        Returns:
+            List of numpy arrays that are strided views over raw, or a 2D
+            (channels, samples) array when stacked is set
+        """
+        dtype, fmts = self.__rx_sample_format()
+        samples = np.frombuffer(raw, dtype=dtype)
+
+        if stacked:
+            fields = [dtype.fields[name] for name in dtype.names]
+            base = fields[0][0]
+            uniform = (
+                all(
+                    f[0] == base and f[1] == i * base.itemsize
+                    for i, f in enumerate(fields)
+                )
+                and dtype.itemsize == len(fields) * base.itemsize
+            )
+            if uniform and not base.shape:
+                # All channels share a format so a 2D strided view is possible
+                block = np.frombuffer(raw, dtype=base).reshape(-1, len(fields)).T
+                rows = [dtype.names.index(name) for name in ecn]
+                if rows != list(range(len(fields))):
+                    block = block[rows]
+                df = fmts[ecn[0]]
+                return self.__rx_convert(block, df)
+            return np.stack(
+                [self.__rx_convert(samples[name], fmts[name]) for name in ecn]
+            )
+
+        return [self.__rx_convert(samples[name], fmts[name]) for name in ecn]
+
+    @staticmethod
+    def __rx_convert(data, df):
+        """Apply the shift and sign extension libiio does in channel reads"""
+        if data.ndim == 2 and df.repeat > 1:
+            data = data.reshape(-1)
+        bits = df.bits if df.bits else df.length
+        if df.shift == 0 and bits == df.length:
+            return data
+        if df.shift:
+            data = data >> df.shift
+        if bits < df.length:
+            if df.is_signed:
+                unused = df.length - bits
+                data = (data << unused) >> unused
+            else:
+                data = data & ((1 << bits) - 1)
+        return data
+
     def __rx_complex(self):
+        if self._rx_output_dtype.kind == "i":
+            return self.__rx_complex_pairs()
+        if self._rx_output_dtype != np.complex128 or self._rx_zero_copy:
+            out = np.empty(
+                (len(self.rx_enabled_channels), self.rx_buffer_size),
+                dtype=self._rx_output_dtype,
+            )
+            self.rx_into(out)
+            if self._rx_stacked and self._rx_zero_copy:
+                return out
+            # Don't return list if a single channel
+            return out[0] if len(out) == 1 else list(out)
+
         x = self.__rx_buffered_data()
         if len(x) % 2 != 0:
             raise Exception(
@@ -264,19 +574,167 @@ class rx(rx_tx_common):
         # Don't return list if a single channel
         return out[0] if len(x) == 2 else out
 
+    def __rx_complex_pairs(self):
+        raw = self.__rx_refill_raw()
+        pairs = self.__rx_iq_pairs(raw)
+        if pairs is None:
+            x = self.__rx_buffer_views(raw, self._rx_enabled_channel_names(), False)
+            pairs = [np.stack(x[i : i + 2], axis=-1) for i in range(0, len(x), 2)]
+        pairs = [p.astype(self._rx_output_dtype, copy=False) for p in pairs]
+        if self._rx_stacked and self._rx_zero_copy:
+            return np.stack(pairs)
+        # Don't return list if a single channel
+        return pairs[0] if len(pairs) == 1 else pairs
+
     def __rx_non_complex(self):
         x = self.__rx_buffered_data()
         if self._rx_output_type == "SI":
             rx_scale = self.__get_rx_channel_scales()
             rx_offset = self.__get_rx_channel_offsets()
+            if isinstance(x, np.ndarray):
+                rx_scale = np.array(rx_scale)[:, np.newaxis]
+                rx_offset = np.array(rx_offset)[:, np.newaxis]
+                return rx_scale * x + rx_offset
             x = x if isinstance(x, list) else [x]
             x = [rx_scale[i] * x[i] + rx_offset[i] for i in range(len(x))]
         elif self._rx_output_type != "raw":
             raise Exception("_rx_output_type undefined")
 
+        if isinstance(x, np.ndarray):
+            return x
         # Don't return list if a single channel
         return x[0] if len(self.rx_enabled_channels) == 1 else x
 
+    def __rx_output_rows(self, out):
+        if isinstance(out, (list, tuple)):
+            rows = list(out)
+        elif isinstance(out, np.ndarray):
+            rows = [out] if out.ndim == 1 else list(out)
+        else:
+            raise Exception("out must be a numpy array or list of numpy arrays")
+        for row in rows:
+            if not isinstance(row, np.ndarray) or row.shape != (self.rx_buffer_size,):
+                raise Exception(
+                    f"Each output must be an array of length {self.rx_buffer_size}"
+                )
+        return rows
+
+    def rx_into(self, out):
+        """Receive data from hardware buffers into caller provided arrays for
+        each channel index in rx_enabled_channels. No output arrays are
+        allocated.
+
+        parameters:
+            out: type=numpy.array or list of numpy.array
+                A 2D (channels, samples) array or a list of 1D arrays, each
+                of length rx_buffer_size. For complex data devices a complex
+                array holds one complex channel per row, while a real array
+                holds the I and Q component channels on separate rows.
+
+        returns: type=numpy.array or list of numpy.array
+            out, filled with the received samples
+        """
+        if self._rx_unbuffered_data:
+            raise Exception("rx_into is not supported for unbuffered devices")
+        rows = self.__rx_output_rows(out)
+        raw = self.__rx_refill_raw()
+
+        if self._complex_data and np.iscomplexobj(rows[0]):
+            if len(rows) != len(self.rx_enabled_channels):
+                raise Exception("Number of outputs must match enabled channels")
+            pairs = self.__rx_iq_pairs(raw)
+            x = None
+            for k, row in enumerate(rows):
+                if pairs is not None and row.flags.c_contiguous:
+                    # Convert straight from the interleaved I/Q pairs
+                    row.view(row.real.dtype).reshape(-1, 2)[...] = pairs[k]
+                    continue
+                if x is None:
+                    ecn = self._rx_enabled_channel_names()
+                    x = self.__rx_buffer_views(raw, ecn, False)
+                row.real[...] = x[2 * k]
+                row.imag[...] = x[2 * k + 1]
+            return out
+
+        x = self.__rx_buffer_views(raw, self._rx_enabled_channel_names(), False)
+        if len(rows) != len(x):
+            raise Exception("Number of outputs must match enabled channels")
+        if self._rx_output_type == "SI" and not self._complex_data:
+            rx_scale = self.__get_rx_channel_scales()
+            rx_offset = self.__get_rx_channel_offsets()
+            for i, row in enumerate(rows):
+                np.multiply(x[i], rx_scale[i], out=row, casting="unsafe")
+                row += rx_offset[i]
+        else:
+            for i, row in enumerate(rows):
+                np.copyto(row, x[i], casting="unsafe")
+        return out
+
+    def _rx_output_layout(self):
+        """Shape and dtype of an output array accepted by rx_into
+
+        For complex data devices with an integer rx_output_dtype, I and Q
+        component channels are on separate rows.
+        """
+        if not self.__rxbuf:
+            self._rx_init_channels()
+        rows = len(self.rx_enabled_channels)
+        if self._complex_data:
+            dtype = self._rx_output_dtype
+            if dtype.kind != "c":
+                rows = rows * 2
+        elif self._rx_output_type == "SI":
+            dtype = np.dtype(np.float64)
+        else:
+            dtype, _ = self.__rx_sample_format()
+            name = self._rx_enabled_channel_names()[0]
+            dtype = dtype.fields[name][0].newbyteorder("=")
+        return (rows, self.rx_buffer_size), dtype
+
+    def __rx_ring_next(self):
+        """Next preallocated output from the ring, (re)allocating if the
+        buffer size, enabled channels or output type changed"""
+        shape, dtype = self._rx_output_layout()
+        ring = self.__rx_output_ring
+        if not ring or ring[0].shape != shape or ring[0].dtype != dtype:
+            ring = [
+                np.empty(shape, dtype=dtype) for _ in range(self._rx_output_ring_size)
+            ]
+            self.__rx_output_ring = ring
+            self.__rx_output_ring_index = 0
+        out = ring[self.__rx_output_ring_index]
+        self.__rx_output_ring_index = (self.__rx_output_ring_index + 1) % len(ring)
+        return out
+
+    def __rx_ring_data(self):
+        out = self.rx_into(self.__rx_ring_next())
+        if self._rx_stacked and self._rx_zero_copy:
+            return out
+        # Don't return list if a single channel
+        return out[0] if len(out) == 1 else list(out)
+
+    def rx_stream(self, queue_size=2, blocks=None, check_overflow=True):
+        """Stream data from hardware buffers for each channel index in
+        rx_enabled_channels, refilling on a background thread.
+
+        parameters:
+            queue_size: type=int
+                Number of received blocks that can wait to be consumed.
+                Blocks received while the queue is full are dropped
+            blocks: type=int
+                Number of blocks to yield before stopping. None streams
+                until the stream is stopped
+            check_overflow: type=bool
+                Count hardware overflows through the DMA status register
+
+        returns: type=adi.stream.rx_streamer
+            An iterator and context manager yielding 2D (channels, samples)
+            arrays in the layout used by rx_into. Each array is reused once
+            the next one is requested. Drop and overflow counts are
+            available from its dropped and overflows attributes.
+        """
+        return rx_streamer(self, queue_size, blocks, check_overflow)
+
     def rx(self):
         """Receive data from hardware buffers for each channel index in
         rx_enabled_channels.
@@ -288,6 +746,8 @@ class rx(rx_tx_common):
         """
         if self._rx_unbuffered_data:
             data = self.__rx_unbuffered_data()
+        elif self._rx_output_ring_size and self._rx_output_dtype.kind == "c":
+            data = self.__rx_ring_data()
         else:
             if self._complex_data:
                 data = self.__rx_complex()
@@ -299,6 +759,16 @@ class rx(rx_tx_common):
             )
         return data
 
+    async def arx(self):
+        """Asynchronously receive data from hardware buffers for each channel
+        index in rx_enabled_channels. The buffer refill runs on the context
+        worker so the event loop is not blocked.
+
+        returns: type=numpy.array or list of numpy.array
+            Same as rx()
+        """
+        return await self._run_async(self.rx)
+
 
 class tx(dds, rx_tx_common):
     """Buffer handling for transmit devices"""
@@ -309,6 +779,7 @@ class tx(dds, rx_tx_common):
     _complex_data = False
     _tx_data_type = np.int16
     __txbuf = None
+    __tx_interleaved = None
     _output_byte_filename = "out.bin"
     _push_to_file = False
 
@@ -411,13 +882,15 @@ class tx(dds, rx_tx_common):
     def _tx_init_channels(self):
         if self._complex_data:
             for m in self.tx_enabled_channels:
-                v = self._txdac.find_channel(self._tx_channel_names[m * 2], True)
+                v = self._find_channel(self._tx_channel_names[m * 2], True, self._txdac)
                 v.enabled = True
-                v = self._txdac.find_channel(self._tx_channel_names[m * 2 + 1], True)
+                v = self._find_channel(
+                    self._tx_channel_names[m * 2 + 1], True, self._txdac
+                )
                 v.enabled = True
         else:
             for m in self.tx_enabled_channels:
-                v = self._txdac.find_channel(self._tx_channel_names[m], True)
+                v = self._find_channel(self._tx_channel_names[m], True, self._txdac)
                 v.enabled = True
         self.__txbuf = iio.Buffer(
             self._txdac, self._tx_buffer_size, self.__tx_cyclic_buffer
@@ -451,36 +924,60 @@ class tx(dds, rx_tx_common):
                 "To push more data the tx buffer must be destroyed first."
             )
 
-        if self._complex_data:
-            if self._num_tx_channels_enabled == 1:
-                data_np = [data_np]
-
-            if len(data_np) != self._num_tx_channels_enabled:
-                raise Exception("Not enough data provided for channel mapping")
-
-            indx = 0
-            stride = self._num_tx_channels_enabled * 2
-            data = np.empty(stride * len(data_np[0]), dtype=self._tx_data_type)
-            for chan in data_np:
-                i = np.real(chan)
-                q = np.imag(chan)
-                data[indx::stride] = i.astype(int)
-                data[indx + 1 :: stride] = q.astype(int)
-                indx = indx + 2
-        else:
-            if self._num_tx_channels_enabled == 1:
-                data_np = [data_np]
+        # Interleave into a reused buffer, it is copied out again on write
+        data, stride = self._tx_interleave(data_np, self.__tx_interleaved)
+        self.__tx_interleaved = data
+        self._tx_push(data, stride)
 
-            if len(data_np) != self._num_tx_channels_enabled:
-                raise Exception("Not enough data provided for channel mapping")
+    def _tx_interleave(self, data_np, out=None):
+        """Interleave per channel data into one sample interleaved array
 
-            indx = 0
-            stride = self._num_tx_channels_enabled
-            data = np.empty(stride * len(data_np[0]), dtype=self._tx_data_type)
-            for chan in data_np:
-                data[indx::stride] = chan.astype(int)
+        parameters:
+            data_np: type=numpy.array or list of numpy.array
+                Samples for each channel in tx_enabled_channels, as passed
+                to tx()
+            out: type=numpy.array
+                Preallocated destination, reused when its length matches
+
+        returns: type=tuple(numpy.array, int)
+            The interleaved data and the number of component channels
+        """
+        if self._num_tx_channels_enabled == 1:
+            data_np = [data_np]
+
+        if len(data_np) != self._num_tx_channels_enabled:
+            raise Exception("Not enough data provided for channel mapping")
+
+        stride = self._num_tx_channels_enabled * (2 if self._complex_data else 1)
+        length = stride * len(data_np[0])
+        if out is None or len(out) != length:
+            out = np.empty(length, dtype=self._tx_data_type)
+
+        indx = 0
+        for chan in data_np:
+            if self._complex_data:
+                self.__tx_copy(out[indx::stride], np.real(chan))
+                self.__tx_copy(out[indx + 1 :: stride], np.imag(chan))
+                indx = indx + 2
+            else:
+                self.__tx_copy(out[indx::stride], chan)
                 indx = indx + 1
+        return out, stride
+
+    def __tx_copy(self, out, chan):
+        """Copy samples into the interleaved buffer. Floating point samples
+        are truncated to integers first, so out of range values wrap around
+        as they did with astype(int) instead of being converted undefined"""
+        chan = np.asarray(chan)
+        if np.issubdtype(chan.dtype, np.floating) and np.issubdtype(
+            out.dtype, np.integer
+        ):
+            chan = chan.astype(int)
+        np.copyto(out, chan, casting="unsafe")
 
+    def _tx_push(self, data, stride):
+        """Write interleaved data to the TX buffer and push it to hardware,
+        creating the buffer on first use"""
         if not self.__txbuf:
             self.disable_dds()
             self._tx_buffer_size = len(data) // stride
@@ -495,12 +992,47 @@ class tx(dds, rx_tx_common):
         # Send data to buffer
         if self._push_to_file:
             f = open(self._output_byte_filename, "ab")
-            f.write(bytearray(data))
+            f.write(data)
             f.close()
         else:
-            self.__txbuf.write(bytearray(data))
+            # Byte view so the copy length matches, without a bytearray copy
+            self.__txbuf.write(data.view(np.uint8))
             self.__txbuf.push()
 
+    def tx_stream(self, source=None, queue_size=2, check_underflow=True):
+        """Stream data to hardware buffers for each channel index in
+        tx_enabled_channels using non-cyclic buffers pushed from a
+        background thread.
+
+        parameters:
+            source: type=iterable
+                Iterable or generator of blocks, each in the format accepted
+                by tx(). When None, blocks are passed to the push method of
+                the returned streamer
+            queue_size: type=int
+                Number of interleaved blocks that can wait to be pushed
+            check_underflow: type=bool
+                Count hardware underflows through the DMA status register
+
+        returns: type=adi.stream.tx_streamer
+            A context manager pushing blocks until the source is exhausted
+            or close() is called. Its pushed and underflows attributes
+            report progress.
+        """
+        if self.tx_cyclic_buffer:
+            raise Exception("tx_stream requires tx_cyclic_buffer to be False")
+        return tx_streamer(self, source, queue_size, check_underflow)
+
+    async def atx(self, data_np=None):
+        """Asynchronously transmit data to hardware buffers for each channel
+        index in tx_enabled_channels. The buffer push runs on the context
+        worker so the event loop is not blocked.
+
+        args: type=numpy.array or list of numpy.array
+            Same as tx()
+        """
+        await self._run_async(self.tx, data_np)
+
 
 class rx_tx(rx, tx, phy):
     def __init__(self):
@@ -587,14 +1119,7 @@ class shared_def(context_manager, metaclass=ABCMeta):
             context_manager.__init__(self, uri_ctx, self._device_name)
         else:
             required_devices = [self._rx_data_device_name, self._control_device_name]
-            contexts = iio.scan_contexts()
-            self._ctx = None
-            for c in contexts:
-                ctx = iio.Context(c)
-                devs = [dev.name for dev in ctx.devices]
-                if all(dev in devs for dev in required_devices):
-                    self._ctx = iio.Context(c)
-                    break
+            self._ctx = self._ctx_discover(required_devices)
             if not self._ctx:
                 raise Exception("No context could be found for class")
 
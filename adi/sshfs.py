@@ -2,6 +2,7 @@
 # SKIP LICENSE INSERTION
 # SPDX short identifier: ADIBSD
 
+import shlex
 from contextlib import suppress
 
 import paramiko
@@ -10,6 +11,8 @@ import paramiko
 class sshfs:
     """Minimal sshfs replacement"""
 
+    _file_marker = "@@pyadi-iio-file@@"
+
     def __init__(self, address, username, password, sshargs=None):
         if address.startswith("ip:"):
             address = address[3:]
@@ -51,3 +54,35 @@ class sshfs:
     def gettext(self, path, *kargs, **kwargs):
         stdout, _ = self._run(f"cat {path}")
         return stdout
+
+    def gettexts(self, paths, glob=False):
+        """Read several text files with a single remote command
+
+        parameters:
+            paths: type=list[string]
+                Paths of the files to read
+            glob: type=bool
+                Expand paths as shell patterns on the remote side
+
+        returns: type=dict
+            Path to file contents. Missing files are left out
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        if not paths:
+            return {}
+        args = " ".join(p if glob else shlex.quote(p) for p in paths)
+        marker = self._file_marker
+        stdout, _ = self._run(
+            f'for f in {args}; do [ -f "$f" ] && echo && echo "{marker}$f" '
+            f'&& cat "$f"; done'
+        )
+        texts = {}
+        path = None
+        for line in stdout.splitlines():
+            if line.startswith(marker):
+                path = line[len(marker) :]
+                texts[path] = []
+            elif path is not None:
+                texts[path].append(line)
+        return {p: "\n".join(lines).strip() for p, lines in texts.items()}
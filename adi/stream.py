@@ -0,0 +1,299 @@
+# Copyright (C) 2024 Analog Devices, Inc.
+#
+# SPDX short identifier: ADIBSD
+
+import queue
+import threading
+
+import numpy as np
+
+_DMA_STATUS_REG = 0x80000088
+_DMA_STATUS_OVF = 0x4
+_DMA_STATUS_UNF = 0x1
+
+
+def _check_dma_status(dev, mask):
+    """Read and clear the DMA status flags in mask. Returns True if set"""
+    v = dev.reg_read(_DMA_STATUS_REG)
+    if v & mask:
+        dev.reg_write(_DMA_STATUS_REG, v)  # Clear
+        return True
+    return False
+
+
+class rx_streamer(object):
+    """Background double buffered RX streaming
+
+    Buffer refills run on a dedicated thread into a bounded queue of
+    preallocated blocks, so the kernel buffers keep being serviced while the
+    caller processes data. Use as an iterator, a context manager, or both.
+
+    parameters:
+        dev: type=adi.rx_tx.rx
+            Receive device to stream from
+        queue_size: type=int
+            Number of received blocks that can wait for the consumer. When
+            the queue is full new blocks are dropped and counted
+        blocks: type=int
+            Number of blocks to yield before stopping. None streams until
+            stop() is called
+        check_overflow: type=bool
+            Read the DMA status register after each refill to count
+            hardware overflows. Disabled automatically when register
+            access is not available
+    """
+
+    def __init__(self, dev, queue_size=2, blocks=None, check_overflow=True):
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+        self._dev = dev
+        self._queue_size = queue_size
+        self._blocks = blocks
+        self._check_overflow = check_overflow
+        self._ready = queue.Queue()
+        self._free = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._started = False
+        self._error = None
+        self.overflows = 0
+        self.dropped = 0
+        self.received = 0
+
+    @property
+    def running(self) -> bool:
+        """running: True while the refill thread is active"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Allocate the block pool and start the refill thread. Does nothing
+        until stop() when already started, even if the refill thread has
+        finished, so blocks still queued are not discarded"""
+        if self._started:
+            return
+        self._started = True
+        shape, dtype = self._dev._rx_output_layout()
+        self._ready = queue.Queue()
+        self._free = queue.Queue()
+        self._error = None
+        self.dropped = 0
+        self.received = 0
+        # One block held by the refill thread, one by the consumer
+        for _ in range(self._queue_size + 2):
+            self._free.put(np.empty(shape, dtype=dtype))
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.__refill_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the refill thread and wait for the current refill to finish"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._started = False
+
+    def __read_overflow(self):
+        try:
+            if _check_dma_status(self._dev._rxadc, _DMA_STATUS_OVF):
+                self.overflows += 1
+        except Exception:
+            self._check_overflow = False
+
+    def __refill_loop(self):
+        try:
+            if self._check_overflow:
+                # Clear stale flags so only overflows while streaming count
+                self.__read_overflow()
+                self.overflows = 0
+            while not self._stop_event.is_set():
+                if self._blocks is not None and self.received >= self._blocks:
+                    break
+                block = self._free.get()
+                self._dev.rx_into(block)
+                if self._check_overflow:
+                    self.__read_overflow()
+                if self._ready.qsize() >= self._queue_size:
+                    # Consumer is behind, drop rather than stall the DMA
+                    self.dropped += 1
+                    self._free.put(block)
+                else:
+                    self._ready.put(block)
+                    self.received += 1
+        except Exception as ex:
+            self._error = ex
+        finally:
+            self._ready.put(None)
+
+    def __iter__(self):
+        self.start()
+        held = None
+        try:
+            while True:
+                block = self._ready.get()
+                if held is not None:
+                    self._free.put(held)
+                    held = None
+                if block is None:
+                    if self._error:
+                        raise self._error
+                    return
+                held = block
+                yield block
+        finally:
+            self.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class tx_streamer(object):
+    """Background non-cyclic TX streaming
+
+    Blocks are interleaved into a pool of preallocated arrays and pushed to
+    hardware from a dedicated thread, so continuous transmission can keep
+    up with the DAC while the next block is prepared.
+
+    parameters:
+        dev: type=adi.rx_tx.tx
+            Transmit device to stream to
+        source: type=iterable
+            Iterable or generator of blocks in the format accepted by tx().
+            When provided it is consumed on a feeder thread, otherwise
+            blocks are passed to push()
+        queue_size: type=int
+            Number of interleaved blocks that can wait to be pushed. push()
+            blocks while the queue is full
+        check_underflow: type=bool
+            Read the DMA status register after each push to count hardware
+            underflows. Disabled automatically when register access is not
+            available
+    """
+
+    def __init__(self, dev, source=None, queue_size=2, check_underflow=True):
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+        self._dev = dev
+        self._source = source
+        self._queue_size = queue_size
+        self._check_underflow = check_underflow
+        self._ready = queue.Queue()
+        self._free = queue.Queue()
+        self._stop_event = threading.Event()
+        self._feeder = None
+        self._pusher = None
+        self._error = None
+        self.underflows = 0
+        self.pushed = 0
+
+    @property
+    def running(self) -> bool:
+        """running: True while the push thread is active"""
+        return self._pusher is not None and self._pusher.is_alive()
+
+    def start(self):
+        """Start the push thread, and the feeder thread when a source is set"""
+        if self.running:
+            return
+        self._ready = queue.Queue()
+        self._free = queue.Queue()
+        self._error = None
+        # Arrays are allocated on first use, once the block length is known.
+        # One more than queue_size for the block being pushed, so push()
+        # blocks once queue_size blocks are waiting
+        for _ in range(self._queue_size + 1):
+            self._free.put(None)
+        self._stop_event.clear()
+        self._pusher = threading.Thread(target=self.__push_loop, daemon=True)
+        self._pusher.start()
+        if self._source is not None:
+            self._feeder = threading.Thread(target=self.__feed_loop, daemon=True)
+            self._feeder.start()
+
+    def push(self, block):
+        """Interleave a block and queue it for transmission
+
+        parameters:
+            block: type=numpy.array or list of numpy.array
+                Samples in the format accepted by tx()
+        """
+        if self._error:
+            raise self._error
+        if not self.running:
+            self.start()
+        out = self._free.get()
+        out, stride = self._dev._tx_interleave(block, out)
+        self._ready.put((out, stride))
+
+    def close(self):
+        """Wait for all queued blocks to be pushed, then stop"""
+        if self._feeder is not None:
+            self._feeder.join()
+            self._feeder = None
+        else:
+            self._ready.put(None)
+        if self._pusher is not None:
+            self._pusher.join()
+            self._pusher = None
+        if self._error:
+            raise self._error
+
+    def stop(self):
+        """Stop streaming, discarding blocks not yet pushed"""
+        self._stop_event.set()
+        self._ready.put(None)
+        self._free.put(None)  # Release a feeder waiting for a free array
+        for thread in (self._feeder, self._pusher):
+            if thread is not None:
+                thread.join()
+        self._feeder = None
+        self._pusher = None
+
+    def __read_underflow(self):
+        try:
+            if _check_dma_status(self._dev._txdac, _DMA_STATUS_UNF):
+                self.underflows += 1
+        except Exception:
+            self._check_underflow = False
+
+    def __feed_loop(self):
+        try:
+            for block in self._source:
+                if self._stop_event.is_set():
+                    break
+                self.push(block)
+        except Exception as ex:
+            self._error = ex
+        finally:
+            self._ready.put(None)
+
+    def __push_loop(self):
+        try:
+            while not self._stop_event.is_set():
+                item = self._ready.get()
+                if item is None:
+                    break
+                out, stride = item
+                self._dev._tx_push(out, stride)
+                self.pushed += 1
+                if self._check_underflow:
+                    self.__read_underflow()
+                self._free.put(out)
+        except Exception as ex:
+            self._error = ex
+            self._stop_event.set()
+            self._free.put(None)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.stop()
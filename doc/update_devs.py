@@ -42,9 +42,13 @@ def update_devs():
         "context_manager",
         "dds",
         "rx_tx",
+        "stream",
+        "ad936x_rates",
+        "profile_cache",
         "sshfs",
         "jesd_internal",
         "sync_start",
+        "multi_som",
         "dsp",
     ]
     adi_rst_path = os.path.join(root, "source", "devices", "adi.rst")
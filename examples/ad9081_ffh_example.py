@@ -65,13 +65,15 @@ dev.tx_main_ffh_mode = ["phase_coherent"] * NM_TX
 dev.rx_main_ffh_mode = ["instantaneous_update"] * NM_RX
 dev.rx_main_ffh_trig_hop_en = [0] * NM_RX
 
-for i in range(N_NCOS):
-    dev.rx_main_nco_ffh_index = [i] * NM_RX
-    dev.rx_main_nco_frequencies = [500000000 + i * 1000000] * NM_RX
-
-for i in range(31):
-    dev.tx_main_ffh_index = [i] * NM_TX
-    dev.tx_main_ffh_frequency = [500000000 + i * 1000000] * NM_TX
+# Program all hop slots from (slot, converter, frequency) tables. Running this
+# again with a modified table only rewrites the slots that changed
+dev.hop_plan(
+    [(i, c, 500000000 + i * 1000000) for i in range(N_NCOS) for c in range(NM_RX)]
+)
+dev.hop_plan(
+    [(i, c, 500000000 + i * 1000000) for i in range(31) for c in range(NM_TX)],
+    output=True,
+)
 
 # Select Rx/Tx NCO channels via register control
 if False:
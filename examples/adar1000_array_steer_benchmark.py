@@ -0,0 +1,62 @@
+# Copyright (C) 2024 Analog Devices, Inc.
+#
+# SPDX short identifier: ADIBSD
+
+""" Benchmark of steering updates per second with the adar1000_array class,
+writing phases live and selecting beams saved to the beam memories """
+
+import time
+
+import adi
+import numpy as np
+
+# Same 4x4 array of 4 ADAR1000s as adar1000_array_example.py
+array = adi.adar1000_array(
+    chip_ids=["csb1_chip1", "csb1_chip2", "csb1_chip3", "csb1_chip4"],
+    device_map=[[1, 2], [3, 4]],
+    element_map=[[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]],
+    device_element_map={
+        1: [5, 6, 2, 1],
+        2: [7, 8, 4, 3],
+        3: [13, 14, 10, 9],
+        4: [15, 16, 12, 11],
+    },
+)
+array.frequency = 12e9
+array.element_spacing = 0.0125
+
+for device in array.devices.values():
+    device.mode = "rx"
+    for channel in device.channels:
+        channel.rx_enable = True
+
+# Sweep the beam across azimuth. Phases are written at the resolution of the
+# phase shifters, so elements whose phase does not change between steps are
+# skipped, and only devices with new phases are latched
+azimuths = np.linspace(-45, 45, 181)
+repeats = 5
+
+start = time.perf_counter()
+for _ in range(repeats):
+    for azimuth in azimuths:
+        array.steer_rx(azimuth=azimuth, elevation=0)
+elapsed = time.perf_counter() - start
+
+updates = repeats * len(azimuths)
+print(f"{updates} steering updates in {elapsed:.3f} s")
+print(f"{updates / elapsed:.1f} updates per second")
+
+# Save the same sweep to the beam memories once, then switch beams by
+# writing only the beam position of each ADAR1000
+beam_azimuths = np.linspace(-45, 45, 121)
+array.save_rx_codebook(beam_azimuths)
+
+start = time.perf_counter()
+for _ in range(repeats):
+    for azimuth in beam_azimuths:
+        array.select_rx_beam(azimuth)
+elapsed = time.perf_counter() - start
+
+updates = repeats * len(beam_azimuths)
+print(f"{updates} beam selections in {elapsed:.3f} s")
+print(f"{updates / elapsed:.1f} selections per second")
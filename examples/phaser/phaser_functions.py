@@ -449,10 +449,7 @@ def phase_cal_sweep(cn0566, peak_bin, ref=0, cal=1):
     # These are all the phase deltas (i.e. phase difference between Rx1 and Rx2, then Rx2 and Rx3, etc.) we'll sweep
     PhaseValues = np.arange(-(sweep_angle), (sweep_angle), cn0566.phase_step_size)
 
-    gain = []  # Create empty lists
-    for phase in PhaseValues:  # These sweeps phase value from -180 to 180
-        # set Phase of channels based on Calibration Flag status and calibration element
-        cn0566.set_chan_phase(cal, phase, apply_cal=False)
+    def measure():
         total_sum = 0
         for count in range(0, cn0566.Averages):  # repeat loop and average the results
             data = cn0566.sdr.rx()  # read a buffer of data
@@ -473,8 +470,13 @@ def phase_cal_sweep(cn0566, peak_bin, ref=0, cal=1):
             s_mag_sum = np.max(s_sum[peak_bin - width : peak_bin + width])
             s_mag_sum = np.max(s_sum)
             total_sum += s_mag_sum
-        PeakValue_sum = total_sum / (cn0566.Averages * cn0566.sdr.rx_buffer_size)
-        gain.append(PeakValue_sum)
+        return total_sum / (cn0566.Averages * cn0566.sdr.rx_buffer_size)
+
+    # Sweep only the phase of the element being calibrated, NaN leaves the
+    # other elements unchanged so each step writes a single phase
+    phases = np.full((len(PhaseValues), cn0566.num_elements), np.nan)
+    phases[:, cal] = PhaseValues
+    gain = list(cn0566.sweep_rx_phases(phases, measure, apply_cal=False))
 
     return (
         PhaseValues,
@@ -155,6 +155,47 @@ def test(c):
         c.run("python3 -m pytest -v")
 
 
+@task
+def importtime(c, limit=None, cls=None):
+    """Measure import time of adi with python -X importtime
+
+    limit: Fail when the cumulative import time in ms exceeds this value
+    cls: Also access this class, for example Pluto, to include its modules
+    """
+    import subprocess
+
+    code = "import adi" + (f"; adi.{cls}" if cls else "")
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if r.returncode:
+        print(r.stderr)
+        sys.exit(r.returncode)
+    total = 0
+    modules = []
+    started = False
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        started = started or name.strip() == "adi"
+        if not started:
+            continue  # Interpreter startup
+        if not name.startswith("  "):
+            # Top level imports, made by "import adi" and the class access
+            total += int(cumulative)
+        modules.append((int(cumulative), name.strip()))
+    print(f"Import time: {total / 1000:.1f} ms ({code})")
+    print("Slowest imports:")
+    for cumulative, name in sorted(modules, reverse=True)[:10]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    if limit is not None and total / 1000 > float(limit):
+        print(f"Import time exceeds limit of {limit} ms")
+        sys.exit(1)
+
+
 @task
 def checkparts(c):
     """Check for missing parts in supported_parts.md"""
@@ -8,6 +8,7 @@ from test.common import (
 )
 
 import adi
+from adi.profile_cache import profiles
 import numpy as np
 import pytest
 
@@ -210,6 +211,153 @@ def attribute_multiple_values(uri, classname, attr, values, tol, repeats=1, slee
                 assert dev_interface(uri, classname, val, attr, tol, sleep=sleep)
 
 
+def attribute_cached(uri, classname, attr, values, tol):
+    """attribute_cached: Write and read back a class property with the
+    attribute read cache enabled. Reads must return the last written value
+    and repeated reads must be served from the cache.
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        attr: type=string
+            Attribute name to be written. Must be property of classname
+        values: type=list
+            A list of values to write and check as attributes
+        tol: type=integer
+            Allowable error of written value compared to read back value
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.attr_cache_enabled = True
+    try:
+        for val in values:
+            setattr(sdr, attr, val)
+            rval = getattr(sdr, attr)
+            assert abs(rval - val) <= tol
+            assert getattr(sdr, attr) == rval
+        sdr.refresh()
+        assert abs(getattr(sdr, attr) - values[-1]) <= tol
+    finally:
+        del sdr
+
+
+def attribute_hop(uri, classname, attr, values, tol, repeats=1):
+    """attribute_hop: Write and read back a class property repeatedly through
+    a list of values on a single object, so state kept by the object between
+    writes is exercised
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        attr: type=string
+            Attribute name to be written. Must be property of classname
+        values: type=list
+            A list of values to write and check as attributes
+        tol: type=integer
+            Allowable error of written value compared to read back value
+        repeats: type=integer
+            Number of times to go through values
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        for _ in range(repeats):
+            for val in values:
+                setattr(sdr, attr, val)
+                assert abs(getattr(sdr, attr) - val) <= tol
+    finally:
+        del sdr
+
+
+def attribute_batch(uri, classname, values):
+    """attribute_batch: Write a set of class properties in a single attribute
+    batch and verify the per attribute results and the read back values
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attributes
+        values: type=dict
+            Property names and the values to write to them
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        with sdr.batch() as batch:
+            for attr, val in values.items():
+                setattr(sdr, attr, val)
+            for attr in values:
+                batch.read(attr)
+        assert not batch.errors
+        for attr, val in values.items():
+            assert batch.results[attr] == val
+            assert getattr(sdr, attr) == val
+    finally:
+        del sdr
+
+
+def attribute_batch_indexed(uri, classname, index_attr, value_attr, values):
+    """attribute_batch_indexed: Write pairs of a selecting index and a value
+    in one attribute batch and verify each value landed in its own slot
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attributes
+        index_attr: type=string
+            Property selecting the slot written by value_attr
+        value_attr: type=string
+            Property written to the selected slot
+        values: type=list
+            Pairs of (index, value) to write in order
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        with sdr.batch() as batch:
+            for index, val in values:
+                setattr(sdr, index_attr, index)
+                setattr(sdr, value_attr, val)
+        assert not batch.errors
+        for index, val in values:
+            setattr(sdr, index_attr, index)
+            assert getattr(sdr, value_attr) == val
+    finally:
+        del sdr
+
+
+def attribute_hop_plan(uri, classname, table, output):
+    """attribute_hop_plan: Program a hop plan, then program it again and with
+    one changed row, and verify only the changed slots are written
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain hop_plan
+        table: type=list
+            Rows of (slot, converter, frequency) or
+            (slot, converter, frequency, phase)
+        output: type=bool
+            Program transmit slots instead of receive slots
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        assert sdr.hop_plan(table, output) == len(table)
+        assert sdr.hop_plan(table, output) == 0
+        changed = list(table[0])
+        changed[2] += 1000000
+        assert sdr.hop_plan([changed], output) == 1
+        plan = sdr.tx_hop_plan if output else sdr.rx_hop_plan
+        assert len(plan) == len(table)
+        freqs = [row[2] for row in plan if row[:2] == tuple(changed[:2])]
+        assert freqs == [changed[2]]
+    finally:
+        del sdr
+
+
 def attribute_multiple_values_with_depends(
     uri, classname, attr, depends, values, tol, repeats=1
 ):
@@ -308,3 +456,53 @@ def attribute_write_only_str_with_depends(uri, classname, attr, value, depends):
     except Exception as e:
         del sdr
         raise Exception(e)
+
+
+def attribute_write_only_str_cached(uri, classname, attr, value, depends=None):
+    """attribute_write_only_str_cached: Write a write only string class
+    property, then write it again from a new object and verify the second
+    write is skipped as the same contents are already loaded, while a
+    forced write through the write_<attr> method is not
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        attr: type=string
+            Attribute name to be written. Must be property of classname
+        value: type=string
+            Value to write into attr property
+        depends: type=dict
+            Dictionary of properties to write before value is written. Keys
+            are properties and values are values to be written
+    """
+    depends = depends or {}
+    # Start with nothing known to be loaded, so the first write is sent
+    profiles.clear()
+    for reload in [False, True]:
+        sdr = eval(classname + "(uri='" + uri + "')")
+        writes = []
+        write = sdr._set_iio_dev_attr_str
+
+        def record(*args, write=write, reload=reload):
+            writes.append(args)
+            if not reload:
+                write(*args)
+
+        sdr._set_iio_dev_attr_str = record
+        try:
+            for p in depends:
+                setattr(sdr, p, depends[p])
+            writes.clear()
+            setattr(sdr, attr, value)
+            written = bool(writes)
+            if reload:
+                getattr(sdr, "write_" + attr)(value, force=True)
+        finally:
+            del sdr
+        if reload:
+            assert not written, "Write of loaded contents was not skipped"
+            assert writes, "Forced write was skipped"
+        else:
+            assert written, "First write was skipped"
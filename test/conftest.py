@@ -77,6 +77,31 @@ def test_attribute_single_value_str(request):
     yield attribute_single_value_str
 
 
+@pytest.fixture()
+def test_attribute_cached(request):
+    yield attribute_cached
+
+
+@pytest.fixture()
+def test_attribute_hop(request):
+    yield attribute_hop
+
+
+@pytest.fixture()
+def test_attribute_batch(request):
+    yield attribute_batch
+
+
+@pytest.fixture()
+def test_attribute_batch_indexed(request):
+    yield attribute_batch_indexed
+
+
+@pytest.fixture()
+def test_attribute_hop_plan(request):
+    yield attribute_hop_plan
+
+
 @pytest.fixture()
 def test_attribute_single_value_pow2(request):
     yield attribute_single_value_pow2
@@ -87,11 +112,36 @@ def test_dma_rx(request):
     yield dma_rx
 
 
+@pytest.fixture()
+def test_dma_rx_zero_copy(request):
+    yield dma_rx_zero_copy
+
+
+@pytest.fixture()
+def test_dma_rx_into(request):
+    yield dma_rx_into
+
+
+@pytest.fixture()
+def test_dma_async(request):
+    yield dma_async
+
+
+@pytest.fixture()
+def test_dma_rx_output_dtype(request):
+    yield dma_rx_output_dtype
+
+
 @pytest.fixture()
 def test_dma_tx(request):
     yield dma_tx
 
 
+@pytest.fixture()
+def test_dma_tx_stream(request):
+    yield dma_tx_stream
+
+
 @pytest.fixture()
 def test_cyclic_buffer(request):
     yield cyclic_buffer
@@ -174,6 +224,11 @@ def test_attribute_write_only_str(request):
     yield attribute_write_only_str
 
 
+@pytest.fixture()
+def test_attribute_write_only_str_cached(request):
+    yield attribute_write_only_str_cached
+
+
 @pytest.fixture()
 def test_dma_dac_zeros(request):
     yield dma_dac_zeros
@@ -184,6 +239,11 @@ def test_dds_two_tone(request):
     yield dds_two_tone
 
 
+@pytest.fixture()
+def test_dds_configure(request):
+    yield dds_configure_diff
+
+
 @pytest.fixture()
 def test_verify_overflow(request):
     yield verify_overflow
@@ -192,3 +252,8 @@ def test_verify_overflow(request):
 @pytest.fixture()
 def test_verify_underflow(request):
     yield verify_underflow
+
+
+@pytest.fixture()
+def test_verify_rx_stream(request):
+    yield verify_rx_stream
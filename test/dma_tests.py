@@ -1,3 +1,4 @@
+import asyncio
 import heapq
 import test.rf.spec as spec
 import time
@@ -71,6 +72,170 @@ def dma_rx(
     del sdr
 
 
+def dma_rx_zero_copy(uri, classname, channel, buffer_size=2 ** 15):
+    """dma_rx_zero_copy: Verify RX data read through single buffer copy views
+    matches the shape and type of the per channel read path, and that the
+    stacked output is a (channels, samples) array
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size: type=int
+            Size of RX buffer in samples. Defaults to 2**15
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    try:
+        ref = sdr.rx()
+        ref = ref if isinstance(ref, list) else [ref]
+        sdr.rx_zero_copy = True
+        for _ in range(10):
+            data = sdr.rx()
+            data = data if isinstance(data, list) else [data]
+            assert len(data) == len(ref)
+            for chan, ref_chan in zip(data, ref):
+                assert chan.shape == ref_chan.shape
+                assert chan.dtype == ref_chan.dtype
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+        sdr.rx_stacked = True
+        data = sdr.rx()
+        assert data.shape == (len(sdr.rx_enabled_channels), buffer_size)
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+
+
+def dma_rx_into(uri, classname, channel, buffer_size=2 ** 15):
+    """dma_rx_into: Verify rx_into fills caller provided arrays in place and
+    that rx() reuses its preallocated output ring
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size: type=int
+            Size of RX buffer in samples. Defaults to 2**15
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    dtype = np.complex64 if sdr._complex_data else np.int16
+    out = np.zeros((len(sdr.rx_enabled_channels), buffer_size), dtype=dtype)
+    try:
+        for _ in range(10):
+            ret = sdr.rx_into(out)
+            assert ret is out
+            for chan in out:
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+        sdr.rx_output_ring_size = 2
+        first = sdr.rx()
+        sdr.rx()
+        third = sdr.rx()
+        first = first if isinstance(first, list) else [first]
+        third = third if isinstance(third, list) else [third]
+        assert np.shares_memory(first[0], third[0])
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+
+
+def dma_async(uri, classname, channel, buffer_size=2 ** 15):
+    """dma_async: Verify arx, atx, aget and aset from an asyncio event loop.
+    A cyclic buffer is transmitted with atx and 10 buffers are received
+    with concurrent arx calls
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=int
+            Channel to enable through rx_enabled_channels and
+            tx_enabled_channels
+        buffer_size: type=int
+            Size of RX and TX buffers in samples. Defaults to 2**15
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = [channel]
+    sdr.tx_enabled_channels = [channel]
+    sdr.tx_cyclic_buffer = True
+    # Ramp so the transmitted buffer is not all zeros
+    ramp = np.arange(buffer_size) % 2 ** 11 * 2 ** 3
+    if sdr._complex_data:
+        ramp = ramp + 1j * ramp
+
+    async def run():
+        await sdr.aset("rx_buffer_size", buffer_size)
+        assert await sdr.aget("rx_buffer_size") == buffer_size
+        await sdr.atx(ramp)
+        return await asyncio.gather(*[sdr.arx() for _ in range(10)])
+
+    try:
+        for data in asyncio.run(run()):
+            assert len(data) == buffer_size
+            assert np.max(np.abs(data)) > 0, "Buffer all zeros"
+        sdr.tx_destroy_buffer()
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+
+
+def dma_rx_output_dtype(uri, classname, channel, dtype, buffer_size=2 ** 15):
+    """dma_rx_output_dtype: Verify complex RX data is produced with the
+    requested rx_output_dtype
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        dtype: type=numpy.dtype
+            Value of rx_output_dtype. complex64, complex128 or an integer
+            type for I/Q pairs
+        buffer_size: type=int
+            Size of RX buffer in samples. Defaults to 2**15
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    sdr.rx_output_dtype = dtype
+    try:
+        for _ in range(10):
+            data = sdr.rx()
+            data = data if isinstance(data, list) else [data]
+            for chan in data:
+                assert chan.dtype == np.dtype(dtype)
+                if np.dtype(dtype).kind == "i":
+                    assert chan.shape == (buffer_size, 2)
+                else:
+                    assert chan.shape == (buffer_size,)
+                assert np.max(np.abs(chan)) > 0, "Buffer all zeros"
+    except Exception as e:
+        del sdr
+        raise Exception(e) from e
+
+    del sdr
+
+
 def dma_tx(uri, classname, channel, use_tx2=False):
     """dma_tx: Construct TX buffers and verify no errors occur when pushed.
     Buffer is of size 2**15 and 10 buffers are pushed
@@ -117,6 +282,49 @@ def dma_tx(uri, classname, channel, use_tx2=False):
     del sdr
 
 
+def dma_tx_stream(uri, classname, channel, blocks=20):
+    """dma_tx_stream: Stream non-cyclic TX buffers from a generator and
+    verify every block is pushed without errors
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through tx_enabled_channels
+        blocks: type=int
+            Number of blocks to stream
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    N = 2 ** 15
+    t = np.arange(N) / N
+    d = np.cos(2 * np.pi * t * 64) * 2 ** 14
+    if sdr._complex_data:
+        d = d + 1j * np.sin(2 * np.pi * t * 64) * 2 ** 14
+
+    if not isinstance(channel, list):
+        sdr.tx_enabled_channels = [channel]
+    else:
+        sdr.tx_enabled_channels = channel
+        d = [d] * len(channel)
+
+    def blocks_gen():
+        for _ in range(blocks):
+            yield d
+
+    try:
+        with sdr.tx_stream(blocks_gen(), queue_size=4) as stream:
+            pass
+        assert stream.pushed == blocks
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+
+    del sdr
+
+
 def dma_dac_zeros(uri, classname, channel):
     """dma_dac_zeros: Test DMA digital loopback with a zeros.
     This test requires a AD936x or similar device with internal loopback
@@ -442,6 +650,43 @@ def dds_two_tone(
         assert tone_peaks[indx[0]] > peak_min2
 
 
+def dds_configure_diff(uri, classname, frequency, scale):
+    """dds_configure_diff: Configure all DDSs from a table with dds_configure
+    and verify the values are applied and that applying the same table again
+    issues no writes
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        frequency: type=integer
+            Frequency in hertz of the generated tones
+        scale: type=float
+            Scale of the generated tones in range [0,1]
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    try:
+        n = len(sdr.dds_scales)
+        tones = [[i, frequency, scale, 90000 * (i % 2), 1] for i in range(n)]
+        sdr.dds_configure(tones)
+        frequencies = sdr.dds_frequencies
+        scales = sdr.dds_scales
+        rewrites = sdr.dds_configure(tones)
+        # Only the changed DDS is written
+        tones[0][1] = frequency * 2
+        changed = sdr.dds_configure(tones)
+    except Exception as e:
+        del sdr
+        raise Exception(e)
+    del sdr
+    for f, s in zip(frequencies, scales):
+        assert abs(float(f) - frequency) <= frequency * 0.01
+        assert abs(float(s) - scale) <= 0.01
+    assert rewrites == 0
+    assert changed == 1
+
+
 def nco_loopback(uri, classname, param_set, channel, frequency, peak_min):
     """nco_loopback: TX/DAC Test tone loopback with connected loopback cables.
     This test requires a devices with TX and RX onboard where the transmit
@@ -1302,3 +1547,51 @@ def verify_overflow(uri, classname, channel, buffer_size, sample_rate):
     del sdr
 
     assert overflow_occured, "No overflow occurred, but one was expected"
+
+
+def verify_rx_stream(uri, classname, channel, buffer_size, sample_rate, blocks=100):
+    """verify_rx_stream: Verify background RX streaming keeps up with the
+    hardware without overflows or dropped blocks, and that blocks received
+    before iteration starts are still yielded
+
+    parameters:
+        uri: type=string
+            URI of IIO context of target board/system
+        classname: type=string
+            Name of pyadi interface class which contain attribute
+        channel: type=list
+            List of integers or list of list of integers of channels to
+            enable through rx_enabled_channels
+        buffer_size type=int
+            Size of RX buffer in samples
+        sample_rate=int
+            Value to set sample rate of device in samples per second
+        blocks=int
+            Number of blocks to stream
+    """
+    sdr = eval(classname + "(uri='" + uri + "')")
+    sdr.rx_enabled_channels = channel if isinstance(channel, list) else [channel]
+    sdr.rx_buffer_size = buffer_size
+    sdr.sample_rate = sample_rate
+    sdr.rx_kernel_buffers_count = 4
+
+    received = 0
+    stream = sdr.rx_stream(queue_size=4, blocks=blocks)
+    with stream:
+        for block in stream:
+            assert block.shape[-1] == buffer_size
+            received += 1
+    overflows, dropped = stream.overflows, stream.dropped
+
+    # Let the refill thread finish before iterating
+    late = sdr.rx_stream(queue_size=4, blocks=2)
+    with late:
+        time.sleep(1)
+        late_received = sum(1 for _ in late)
+
+    del sdr
+
+    assert received == blocks, f"Only {received} of {blocks} blocks received"
+    assert late_received == 2, f"Only {late_received} of 2 queued blocks yielded"
+    assert dropped == 0, f"{dropped} blocks dropped"
+    assert overflows == 0, f"{overflows} overflows occurred"
@@ -92,6 +92,60 @@ def test_ad9081_attr(
     )
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "values",
+    [
+        {
+            "loopback_mode": 0,
+            "rx_test_mode": "off",
+            "tx_main_ffh_mode": "phase_coherent",
+        },
+    ],
+)
+def test_ad9081_attr_batch(test_attribute_batch, iio_uri, classname, values):
+    test_attribute_batch(iio_uri, classname, values)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "index_attr, value_attr, values",
+    [
+        (
+            "tx_main_ffh_index",
+            "tx_main_ffh_frequency",
+            [
+                ([1] * 4, [100000000] * 4),
+                ([2] * 4, [200000000] * 4),
+                ([3] * 4, [300000000] * 4),
+            ],
+        ),
+    ],
+)
+def test_ad9081_attr_batch_indexed(
+    test_attribute_batch_indexed, iio_uri, classname, index_attr, value_attr, values
+):
+    test_attribute_batch_indexed(iio_uri, classname, index_attr, value_attr, values)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "table, output",
+    [
+        ([(i, 0, 500000000 + i * 1000000, 0) for i in range(16)], False),
+        ([(i, 0, 500000000 + i * 1000000) for i in range(31)], True),
+    ],
+)
+def test_ad9081_hop_plan(test_attribute_hop_plan, iio_uri, classname, table, output):
+    test_attribute_hop_plan(iio_uri, classname, table, output)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -100,6 +154,33 @@ def test_ad9081_rx_data(test_dma_rx, iio_uri, classname, channel):
     test_dma_rx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [[0], [0, 1, 2, 3]])
+def test_ad9081_rx_data_zero_copy(test_dma_rx_zero_copy, iio_uri, classname, channel):
+    test_dma_rx_zero_copy(iio_uri, classname, channel)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [[0], [0, 1, 2, 3]])
+def test_ad9081_rx_into(test_dma_rx_into, iio_uri, classname, channel):
+    test_dma_rx_into(iio_uri, classname, channel)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1, 2, 3]])
+@pytest.mark.parametrize("dtype", ["complex64", "complex128", "int16"])
+def test_ad9081_rx_output_dtype(
+    test_dma_rx_output_dtype, iio_uri, classname, channel, dtype
+):
+    test_dma_rx_output_dtype(iio_uri, classname, channel, dtype)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -108,6 +189,14 @@ def test_ad9081_tx_data(test_dma_tx, iio_uri, classname, channel):
     test_dma_tx(iio_uri, classname, channel)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0, [0, 1, 2, 3]])
+def test_ad9081_tx_stream(test_dma_tx_stream, iio_uri, classname, channel):
+    test_dma_tx_stream(iio_uri, classname, channel)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -328,3 +417,12 @@ def test_ad9081_nco_loopback(
 
 
 #########################################
+@pytest.mark.iio_hardware(hardware)
+def test_ad9081_jesd_monitor(iio_uri):
+    import adi
+
+    dev = adi.ad9081(uri=iio_uri)
+    monitor = adi.jesd_monitor({"ad9081": dev})
+    assert monitor.sample() == []
+    assert ("ad9081", "jesd204_fsm", None, "state") in monitor.snapshot
+    del dev
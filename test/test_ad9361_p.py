@@ -146,6 +146,38 @@ def test_ad9361_attr(
     )
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "attr, values, tol",
+    [
+        ("rx_lo", [1000000000, 2400000000], 8),
+        ("sample_rate", [30720000, 15360000], 4),
+    ],
+)
+def test_ad9361_attr_cached(
+    test_attribute_cached, iio_uri, classname, attr, values, tol
+):
+    test_attribute_cached(iio_uri, classname, attr, values, tol)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize(
+    "attr, values, tol, repeats",
+    [
+        ("sample_rate", [30720000, 25000000, 10000000, 5000000, 1000000], 4, 3),
+        ("sample_rate", [61440000, 45000000, 30720000, 2000000], 4, 3),
+    ],
+)
+def test_ad9361_sample_rate_hop(
+    test_attribute_hop, iio_uri, classname, attr, values, tol, repeats
+):
+    test_attribute_hop(iio_uri, classname, attr, values, tol, repeats)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
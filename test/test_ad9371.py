@@ -824,3 +824,13 @@ def test_ad9371_profile_write(
     test_attribute_write_only_str, iio_uri, classname, attr, files
 ):
     test_attribute_write_only_str(iio_uri, classname, attr, files)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("attr", ["profile"])
+def test_ad9371_profile_write_cached(
+    test_attribute_write_only_str_cached, iio_uri, classname, attr
+):
+    test_attribute_write_only_str_cached(iio_uri, classname, attr, test_profiles[0])
@@ -244,6 +244,27 @@ def test_adrv9002_profile_write(
     )
 
 
+#########################################
+@pytest.mark.lvds_test
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("attr", ["profile"])
+@pytest.mark.parametrize(
+    "profile_file, depends", [(lte_20_lvds_profile, {"stream": lte_20_lvds_stream})]
+)
+def test_adrv9002_profile_write_cached(
+    test_attribute_write_only_str_cached,
+    iio_uri,
+    classname,
+    attr,
+    profile_file,
+    depends,
+):
+    test_attribute_write_only_str_cached(
+        iio_uri, classname, attr, profile_file, depends
+    )
+
+
 #########################################
 @pytest.mark.lvds_test
 @pytest.mark.iio_hardware(hardware)
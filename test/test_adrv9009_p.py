@@ -888,6 +888,16 @@ def test_adrv9009_profile_write(
     test_attribute_write_only_str(iio_uri, classname, attr, files)
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("attr", ["profile"])
+def test_adrv9009_profile_write_cached(
+    test_attribute_write_only_str_cached, iio_uri, classname, attr
+):
+    test_attribute_write_only_str_cached(iio_uri, classname, attr, test_profiles[0])
+
+
 #########################################
 @pytest.mark.skipif(skip_jesd, reason="JESD module not importable")
 @pytest.mark.iio_hardware(hardware)
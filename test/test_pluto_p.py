@@ -157,6 +157,14 @@ def test_pluto_dds_loopback(
     )
 
 
+#########################################
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("frequency, scale", [(1000000, 0.5)])
+def test_pluto_dds_configure(test_dds_configure, iio_uri, classname, frequency, scale):
+    test_dds_configure(iio_uri, classname, frequency, scale)
+
+
 #########################################
 @pytest.mark.iio_hardware(hardware, True)
 @pytest.mark.parametrize("classname", [(classname)])
@@ -221,3 +229,45 @@ def test_pluto_verify_underflow(
     test_verify_underflow, iio_uri, classname, channel, buffer_size, sample_rate
 ):
     test_verify_underflow(iio_uri, classname, channel, buffer_size, sample_rate)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+@pytest.mark.parametrize("buffer_size", [2 ** 16])
+@pytest.mark.parametrize("sample_rate", [600e3])
+def test_pluto_verify_rx_stream(
+    test_verify_rx_stream, iio_uri, classname, channel, buffer_size, sample_rate
+):
+    test_verify_rx_stream(iio_uri, classname, channel, buffer_size, sample_rate)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware, True)
+@pytest.mark.parametrize("classname", [(classname)])
+@pytest.mark.parametrize("channel", [0])
+def test_pluto_dma_async(test_dma_async, iio_uri, classname, channel):
+    test_dma_async(iio_uri, classname, channel)
+
+
+#########################################
+@pytest.mark.iio_hardware(hardware)
+def test_pluto_shared_context(iio_uri):
+    import adi
+    from adi.context_manager import shared_contexts
+
+    sdr1 = adi.Pluto(uri=iio_uri)
+    sdr2 = adi.Pluto(uri=iio_uri)
+    assert sdr1.ctx is not sdr2.ctx
+    shared_contexts.enabled = True
+    try:
+        sdr3 = adi.Pluto(uri=iio_uri)
+        sdr4 = adi.Pluto(uri=iio_uri)
+        assert sdr3.ctx is sdr4.ctx
+        sdr4.reconnect()
+        assert sdr3.rx_lo == sdr4.rx_lo
+        del sdr3, sdr4
+    finally:
+        shared_contexts.enabled = False
+    del sdr1, sdr2
@@ -32,3 +32,13 @@ def test_sshfs_listdir(iio_uri, classname, username, password):
 def test_sshfs_gettext(iio_uri, classname, username, password):
     sshfs = open_sshfs(classname, iio_uri, username, password)
     assert sshfs.gettext("/proc/version").startswith("Linux version")
+
+
+@pytest.mark.iio_hardware(hardware)
+@pytest.mark.parametrize("classname", [(classname)])
+def test_sshfs_gettexts(iio_uri, classname, username, password):
+    sshfs = open_sshfs(classname, iio_uri, username, password)
+    texts = sshfs.gettexts(["/proc/version", "/etc/os-release", "/nonexistent"])
+    assert texts["/proc/version"] == sshfs.gettext("/proc/version")
+    assert "/etc/os-release" in texts
+    assert "/nonexistent" not in texts